@@ -5,12 +5,19 @@ This module contains the primary data structures used throughout the system
 for representing documents, resources, templates, and validation results.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
+# Models built on every tool call or generated document are slotted to drop
+# the per-instance __dict__; dataclass(slots=True) needs Python 3.10, older
+# versions go without
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 @dataclass
 class DocumentResult:
     """Result of document generation operation."""
@@ -161,6 +168,8 @@ class ProcessingContext:
     generation_mode: str = "full"  # 'full', 'minimal', 'enhanced'
     custom_sections: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Document structures extracted from this context, keyed by document type
+    extracted_structures: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for processing."""
@@ -175,7 +184,7 @@ class ProcessingContext:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PromptResult:
     """Result of prompt generation for AI processing."""
 
@@ -231,7 +240,7 @@ class GenerationRequest:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AIGeneratedContent:
     """Content generated by AI that needs to be saved."""
 
@@ -256,7 +265,7 @@ class AIGeneratedContent:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ContentValidationResult:
     """Result of validating AI-generated content."""
 
@@ -8,8 +8,10 @@ for each type of document generated by the system.
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from .core import _SLOTS
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class PRDStructure:
     """Structure for Product Requirements Document."""
     
@@ -78,7 +80,7 @@ class PRDStructure:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SPECStructure:
     """Structure for Technical Specification Document."""
     
@@ -168,7 +170,7 @@ class SPECStructure:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DESIGNStructure:
     """Structure for Design Document."""
 
@@ -8,6 +8,7 @@ providing a consistent interface for content extraction and metadata handling.
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+import io
 import logging
 import asyncio
 from datetime import datetime
@@ -16,6 +17,7 @@ from ..models.core import FileContent
 from ..exceptions import FileProcessingError, UnsupportedFormatError
 from ..security import (
     validate_file_access,
+    validate_and_open,
     get_security_logger,
     log_file_access,
     log_security_event,
@@ -39,6 +41,10 @@ class FileProcessor(ABC):
         self.encoding_fallbacks = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
         self.security_config = security_config
     
+    def _base_directory(self) -> Optional[Path]:
+        """Get the directory file access is restricted to, if any."""
+        return Path.cwd() if self.security_config.restrict_to_base_directory else None
+    
     def can_process(self, file_path: Path) -> bool:
         """Check if this processor can handle the given file."""
         return file_path.suffix.lower() in self.supported_extensions
@@ -46,12 +52,15 @@ class FileProcessor(ABC):
     async def process_file(self, file_path: Path) -> FileContent:
         """Process a file and extract its content."""
         try:
-            # Security validation
+            # Security validation. Existence and readability are enforced
+            # every time content is read: all processors read through
+            # _read_binary_file_sync, which uses validate_and_open, so only
+            # the path policy is checked here.
             validated_path = validate_file_access(
                 file_path,
-                base_directory=Path.cwd() if self.security_config.restrict_to_base_directory else None,
-                check_exists=True,
-                check_readable=True
+                base_directory=self._base_directory(),
+                check_exists=False,
+                check_readable=False
             )
 
             log_file_access(validated_path, "read", success=True)
@@ -161,10 +170,12 @@ class FileProcessor(ABC):
         else:
             encodings_to_try = self.encoding_fallbacks
         
+        # Read once; each fallback encoding only re-decodes the bytes
+        raw_content = await self._read_binary_file(file_path)
+        
         for enc in encodings_to_try:
             try:
-                # Use asyncio.to_thread to run the entire file read operation
-                content = await asyncio.to_thread(self._read_file_sync, file_path, enc)
+                content = await asyncio.to_thread(self._decode_text_sync, raw_content, enc)
                 logger.debug(f"Successfully read {file_path} with encoding {enc}")
                 return content
             except UnicodeDecodeError:
@@ -184,10 +195,9 @@ class FileProcessor(ABC):
             ]
         )
     
-    def _read_file_sync(self, file_path: Path, encoding: str) -> str:
-        """Synchronous file reading helper for asyncio.to_thread."""
-        with open(file_path, 'r', encoding=encoding) as f:
-            return f.read()
+    def _decode_text_sync(self, raw_content: bytes, encoding: str) -> str:
+        """Decode file content the way a text-mode open() would, newlines included."""
+        return io.TextIOWrapper(io.BytesIO(raw_content), encoding=encoding).read()
     
     async def _read_binary_file(self, file_path: Path) -> bytes:
         """Read binary file content."""
@@ -201,8 +211,11 @@ class FileProcessor(ABC):
     
     def _read_binary_file_sync(self, file_path: Path) -> bytes:
         """Synchronous binary file reading helper for asyncio.to_thread."""
-        with open(file_path, 'rb') as f:
-            return f.read()
+        # Read from the descriptor that passed validation, closing the
+        # window between checking the path and opening it
+        _, file_obj = validate_and_open(file_path, base_directory=self._base_directory())
+        with file_obj:
+            return file_obj.read()
     
     def _clean_extracted_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
@@ -6,7 +6,9 @@ using OCR when available.
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+import asyncio
+import io
 import logging
 
 try:
@@ -55,25 +57,25 @@ class ImageProcessor(FileProcessor):
         
         try:
             # Open and process image
-            image = Image.open(file_path)
+            image = await asyncio.to_thread(self._open_image, file_path)
             
-            # Convert to RGB if necessary (for better OCR)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Convert to RGB if necessary (for better OCR); the original keeps
+            # the format and mode reported in the description
+            ocr_image = image.convert('RGB') if image.mode != 'RGB' else image
             
             # Perform OCR
-            extracted_text = pytesseract.image_to_string(image)
+            extracted_text = pytesseract.image_to_string(ocr_image)
             
             if not extracted_text.strip():
                 # No text found, return image description
-                description = self._get_image_description(file_path)
+                description = self._get_image_description(file_path, image)
                 return f"No text detected in image.\n\n{description}"
             
             # Clean and return extracted text
             cleaned_text = self._clean_extracted_text(extracted_text)
             
             # Add image description as context
-            description = self._get_image_description(file_path)
+            description = self._get_image_description(file_path, image)
             return f"{cleaned_text}\n\n--- Image Information ---\n{description}"
             
         except Exception as e:
@@ -91,7 +93,7 @@ class ImageProcessor(FileProcessor):
             return metadata
         
         try:
-            image = Image.open(file_path)
+            image = await asyncio.to_thread(self._open_image, file_path)
             
             metadata['pil_available'] = True
             metadata['image_format'] = image.format
@@ -142,11 +144,16 @@ class ImageProcessor(FileProcessor):
         
         return metadata
     
-    def _get_image_description(self, file_path: Path) -> str:
+    def _open_image(self, file_path: Path) -> 'Image.Image':
+        """Open an image from the bytes of the descriptor that passed validation."""
+        return Image.open(io.BytesIO(self._read_binary_file_sync(file_path)))
+    
+    def _get_image_description(self, file_path: Path, image: Optional['Image.Image'] = None) -> str:
         """Get basic description of image when OCR is not available."""
         try:
             if PIL_AVAILABLE:
-                image = Image.open(file_path)
+                if image is None:
+                    image = self._open_image(file_path)
                 return (f"Image file: {file_path.name}\n"
                        f"Format: {image.format}\n"
                        f"Size: {image.width}x{image.height} pixels\n"
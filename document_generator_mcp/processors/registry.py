@@ -32,6 +32,9 @@ class FileProcessorRegistry:
         self._processors: Dict[str, FileProcessor] = {}
         self._extension_map: Dict[str, str] = {}
         
+        # Bumped on every (un)registration so callers can cache derived data
+        self._version = 0
+        
         # Register default processors
         self._register_default_processors()
     
@@ -66,6 +69,7 @@ class FileProcessorRegistry:
                 logger.warning(f"Extension {ext} already mapped to {self._extension_map[ext]}, overriding with {name}")
             self._extension_map[ext] = name
         
+        self._version += 1
         logger.info(f"Registered processor '{name}' for extensions: {processor.supported_extensions}")
     
     def unregister_processor(self, name: str) -> None:
@@ -81,8 +85,14 @@ class FileProcessorRegistry:
                 del self._extension_map[ext]
         
         del self._processors[name]
+        self._version += 1
         logger.info(f"Unregistered processor: {name}")
     
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the set of processors changes."""
+        return self._version
+    
     def get_processor(self, file_path: Path) -> FileProcessor:
         """Get the appropriate processor for a file."""
         extension = file_path.suffix.lower()
@@ -19,6 +19,7 @@ from .path_security import (
     is_safe_path,
     normalize_path,
     validate_file_access,
+    validate_and_open,
 )
 
 from .content_security import (
@@ -40,6 +41,7 @@ from .logging_security import (
     sanitize_log_data,
     log_file_access,
     log_input_validation,
+    SecurityEventBatch,
 )
 
 __all__ = [
@@ -53,6 +55,7 @@ __all__ = [
     "is_safe_path",
     "normalize_path",
     "validate_file_access",
+    "validate_and_open",
     "sanitize_template_content",
     "validate_template_structure",
     "prevent_template_injection",
@@ -65,4 +68,5 @@ __all__ = [
     "sanitize_log_data",
     "log_file_access",
     "log_input_validation",
+    "SecurityEventBatch",
 ]
@@ -45,6 +45,7 @@ class SecurityConfig:
     max_memory_usage: int = 512 * 1024 * 1024  # 512MB
     enable_rate_limiting: bool = True
     max_requests_per_minute: int = 60
+    max_concurrent_requests: int = 10
     
     # Logging security
     log_security_events: bool = True
@@ -78,6 +79,9 @@ class SecurityConfig:
         if self.max_processing_time <= 0:
             issues.append("max_processing_time must be positive")
         
+        if self.max_concurrent_requests <= 0:
+            issues.append("max_concurrent_requests must be positive")
+        
         # Validate file extensions
         for ext in self.allowed_file_extensions:
             if not ext.startswith('.'):
@@ -135,6 +139,7 @@ def get_secure_defaults() -> SecurityConfig:
         max_memory_usage=256 * 1024 * 1024,  # 256MB (reduced from 512MB)
         enable_rate_limiting=True,
         max_requests_per_minute=30,  # Reduced from 60
+        max_concurrent_requests=5,  # Reduced from 10
         
         # Secure logging
         log_security_events=True,
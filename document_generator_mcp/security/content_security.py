@@ -6,11 +6,11 @@ and prevent various injection attacks.
 """
 
 import re
-import html
 from typing import Any, Dict, List, Optional, Set
 import logging
 
 from ..exceptions import ValidationError, TemplateValidationError
+from .path_security import _CTRL_RE
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +32,26 @@ TEMPLATE_INJECTION_PATTERNS = [
 # Safe template placeholder pattern
 SAFE_PLACEHOLDER_PATTERN = r'^\{[a-zA-Z_][a-zA-Z0-9_]*\}$'
 
+# Deletion table for C0 control characters other than tab, newline and carriage return
+_NON_PRINTABLE_TABLE = dict.fromkeys(
+    [c for c in range(32) if chr(c) not in '\t\n\r']
+)
+
+# Metadata keys accepted on templates
+ALLOWED_METADATA_KEYS = frozenset({
+    'description', 'author', 'supports_customization',
+    'requires_prd', 'requires_spec', 'created_date'
+})
+
+# Single-pass equivalent of html.escape(quote=True)
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
 # Content patterns that might indicate injection attempts
 CONTENT_INJECTION_PATTERNS = [
     r'<script[^>]*>.*?</script>',  # Script tags
@@ -72,7 +92,7 @@ def sanitize_user_content(content: str,
         )
     
     # Remove null bytes and most control characters
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', content)
+    sanitized = _CTRL_RE.sub('', content)
     
     # Check for and remove dangerous content patterns
     for pattern in CONTENT_INJECTION_PATTERNS:
@@ -82,7 +102,7 @@ def sanitize_user_content(content: str,
     
     # HTML escape if not preserving formatting
     if not preserve_formatting:
-        sanitized = html.escape(sanitized)
+        sanitized = sanitized.translate(_HTML_ESCAPE_TABLE)
     else:
         # Only escape the most dangerous HTML entities
         sanitized = sanitized.replace('<script', '&lt;script')
@@ -237,18 +257,12 @@ def validate_template_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
         return {}
     
     validated_metadata = {}
-    allowed_keys = {
-        'description', 'author', 'supports_customization', 
-        'requires_prd', 'requires_spec', 'created_date'
-    }
-    
     for key, value in metadata.items():
-        if not isinstance(key, str):
-            continue
-        
-        # Only allow safe metadata keys
-        if key not in allowed_keys:
-            logger.warning(f"Unexpected metadata key: {key}")
+        # Only allow safe metadata keys; non-string keys are never in the set
+        # and are dropped silently
+        if key not in ALLOWED_METADATA_KEYS:
+            if isinstance(key, str):
+                logger.warning(f"Unexpected metadata key: {key}")
             continue
         
         # Sanitize metadata values
@@ -325,12 +339,14 @@ def validate_template_context(context: Dict[str, Any]) -> Dict[str, Any]:
             logger.warning(f"Invalid context key: {key}")
             continue
         
-        # Validate and sanitize value
-        if isinstance(value, str):
+        # Validate and sanitize value (exact-type dispatch; context values
+        # are built-in types, so subclasses fall through to str())
+        value_type = type(value)
+        if value_type is str:
             validated_context[key] = sanitize_user_content(value)
-        elif isinstance(value, (int, float, bool)) or value is None:
+        elif value_type is int or value_type is float or value_type is bool or value is None:
             validated_context[key] = value
-        elif isinstance(value, (list, tuple)):
+        elif value_type is list or value_type is tuple:
             # Convert list/tuple to string representation
             validated_context[key] = sanitize_user_content(str(value))
         else:
@@ -340,42 +356,62 @@ def validate_template_context(context: Dict[str, Any]) -> Dict[str, Any]:
     return validated_context
 
 
-def detect_content_anomalies(content: str) -> List[str]:
+def detect_content_anomalies(content: str, short_circuit: bool = False) -> List[str]:
     """
     Detect potential security anomalies in content.
     
+    Cheap substring and line-length checks run first; the character
+    distribution and repetition scans run last.
+    
     Args:
         content: Content to analyze
+        short_circuit: Return as soon as the first anomaly is found
         
     Returns:
         List of detected anomalies
     """
     anomalies = []
+    content_length = len(content)
+    
+    # Check for potential encoding attacks
+    if '\\x' in content or '\\u' in content:
+        anomalies.append("Potential encoding-based attack detected")
+        if short_circuit:
+            return anomalies
+    
+    # Check for extremely long lines (potential buffer overflow attempts).
+    # No line can exceed the limit unless the content itself does.
+    if content_length > 10000:
+        max_line_length = 0
+        start = 0
+        while start <= content_length:
+            end = content.find('\n', start)
+            if end == -1:
+                end = content_length
+            max_line_length = max(max_line_length, end - start)
+            start = end + 1
+        
+        if max_line_length > 10000:
+            anomalies.append(f"Extremely long line detected: {max_line_length} characters")
+            if short_circuit:
+                return anomalies
+    
+    # Check for unusual character distributions
+    if content_length > 100:
+        non_printable_count = content_length - len(content.translate(_NON_PRINTABLE_TABLE))
+        if non_printable_count > content_length * 0.1:
+            anomalies.append("High ratio of non-printable characters")
+            if short_circuit:
+                return anomalies
     
     # Check for excessive repetition (potential DoS)
-    if len(content) > 1000:
+    if content_length > 1000:
         # Check for repeated patterns
         for pattern_length in [10, 50, 100]:
-            if pattern_length * 10 < len(content):
+            if pattern_length * 10 < content_length:
                 pattern = content[:pattern_length]
-                if content.count(pattern) > len(content) // pattern_length // 2:
+                if content.count(pattern) > content_length // pattern_length // 2:
                     anomalies.append(f"Excessive repetition detected (pattern length: {pattern_length})")
                     break
     
-    # Check for unusual character distributions
-    if len(content) > 100:
-        non_printable_count = sum(1 for c in content if ord(c) < 32 and c not in '\t\n\r')
-        if non_printable_count > len(content) * 0.1:
-            anomalies.append("High ratio of non-printable characters")
-    
-    # Check for potential encoding attacks
-    if '\\x' in content or '\\u' in content:
-        anomalies.append("Potential encoding-based attack detected")
-    
-    # Check for extremely long lines (potential buffer overflow attempts)
-    lines = content.split('\n')
-    max_line_length = max(len(line) for line in lines) if lines else 0
-    if max_line_length > 10000:
-        anomalies.append(f"Extremely long line detected: {max_line_length} characters")
-    
     return anomalies
@@ -5,11 +5,18 @@ This module provides secure logging functions that prevent information
 leakage while maintaining useful audit trails.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import re
 import json
+import sys
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from pathlib import Path
 
 from .validators import sanitize_content
@@ -30,6 +37,81 @@ SENSITIVE_PATTERNS = [
 # Compile patterns for performance
 COMPILED_SENSITIVE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in SENSITIVE_PATTERNS]
 
+# Last (epoch millisecond, isoformat) pair used for security event timestamps
+_TS_CACHE: Tuple[int, str] = (0, '')
+
+# Background listener draining the root logger's queue (see setup_secure_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _BatchingStderrHandler(logging.Handler):
+    """
+    Write formatted records to stderr in coalesced batches.
+    
+    Records are buffered and written with a single write() per flush
+    interval by a background thread instead of one write per record.
+    ERROR and above wake the thread for an immediate flush so failures are
+    never held back, and a full buffer is flushed by the emitting caller so
+    memory stays bounded.
+    """
+    
+    def __init__(self, flush_interval: float = 0.05, max_buffered: int = 1000):
+        """Initialize the handler and start its flush thread."""
+        super().__init__()
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self._buffer: List[str] = []
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._flusher = threading.Thread(
+            target=self._run, name="log-flusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        
+        if len(self._buffer) >= self.max_buffered:
+            # Flush in the caller rather than waiting on the thread, so a
+            # burst cannot outgrow the buffer; handle() already holds the lock
+            self.flush()
+        elif record.levelno >= logging.ERROR:
+            self._wakeup.set()
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if not self._buffer:
+                return
+            data = '\n'.join(self._buffer) + '\n'
+            self._buffer.clear()
+            # Looked up per write so stream redirection keeps working
+            stream = sys.stderr
+            try:
+                stream.write(data)
+                stream.flush()
+            except (OSError, ValueError):
+                pass  # stderr closed or gone; nothing useful left to do
+        finally:
+            self.release()
+    
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+    
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+        self._flusher.join()
+        self.flush()
+        super().close()
+
 
 class SecurityLogger:
     """Security-focused logger that sanitizes sensitive information."""
@@ -53,8 +135,9 @@ class SecurityLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        # Ensure handlers have the formatter
-        if not self.logger.handlers:
+        # Ensure handlers have the formatter. When secure logging is configured
+        # the root logger's queue handler already covers this logger.
+        if not self.logger.handlers and _queue_listener is None:
             handler = logging.StreamHandler()
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
@@ -68,7 +151,7 @@ class SecurityLogger:
         
         Args:
             message: Original message
-            
+        
         Returns:
             Sanitized message
         """
@@ -126,13 +209,32 @@ def get_security_logger(name: str, sanitize_logs: bool = True) -> SecurityLogger
     Args:
         name: Logger name
         sanitize_logs: Whether to sanitize log messages
-        
+    
     Returns:
         SecurityLogger instance
     """
     return SecurityLogger(name, sanitize_logs)
 
 
+def _event_timestamp() -> str:
+    """
+    Get an ISO timestamp for a security event, reused within the same millisecond.
+    
+    Returns:
+        ISO 8601 timestamp string
+    """
+    global _TS_CACHE
+    
+    now_ms = time.time_ns() // 1_000_000
+    cached_ms, cached_ts = _TS_CACHE
+    if cached_ms == now_ms:
+        return cached_ts
+    
+    timestamp = datetime.now().isoformat()
+    _TS_CACHE = (now_ms, timestamp)
+    return timestamp
+
+
 def log_security_event(event_type: str, 
                       details: Dict[str, Any],
                       severity: str = "INFO",
@@ -150,7 +252,7 @@ def log_security_event(event_type: str,
     
     # Create structured log entry
     log_entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _event_timestamp(),
         "event_type": event_type,
         "details": sanitize_log_data(details),
     }
@@ -176,6 +278,10 @@ def log_security_event(event_type: str,
         security_logger.info(log_message)
 
 
+# Types sanitize_log_data can dispatch on without an isinstance fallback
+_BUILTIN_LOG_TYPES = frozenset({str, int, float, bool, dict, list, tuple, type(None)})
+
+
 def sanitize_log_data(data: Any, max_depth: int = 5, current_depth: int = 0) -> Any:
     """
     Recursively sanitize data for logging.
@@ -184,14 +290,47 @@ def sanitize_log_data(data: Any, max_depth: int = 5, current_depth: int = 0) ->
         data: Data to sanitize
         max_depth: Maximum recursion depth
         current_depth: Current recursion depth
-        
+    
     Returns:
         Sanitized data
     """
     if current_depth > max_depth:
         return "[MAX_DEPTH_EXCEEDED]"
     
-    if isinstance(data, dict):
+    # Dispatch on the exact type: log payloads are almost always built-in
+    # containers and scalars, so a pointer compare is cheaper than isinstance.
+    # Subclasses (OrderedDict, defaultdict, str enums, ...) are mapped onto
+    # their base type so they still get key redaction and string scrubbing.
+    data_type = type(data)
+    if data_type not in _BUILTIN_LOG_TYPES:
+        if isinstance(data, str):
+            data_type = str
+        elif isinstance(data, dict):
+            data_type = dict
+        elif isinstance(data, (list, tuple)):
+            data_type = list
+        elif isinstance(data, (int, float)):
+            data_type = int
+    
+    if data_type is str:
+        # Limit string length and sanitize
+        limited_str = data[:1000]  # Limit to 1000 characters
+        
+        # Check for sensitive patterns
+        for pattern in COMPILED_SENSITIVE_PATTERNS:
+            if pattern.search(limited_str):
+                return "[REDACTED_STRING]"
+        
+        # Basic sanitization
+        try:
+            return sanitize_content(limited_str, max_length=1000)
+        except Exception:
+            return "[SANITIZATION_FAILED]"
+    
+    elif data_type is int or data_type is float or data_type is bool or data is None:
+        return data
+    
+    elif data_type is dict:
         sanitized = {}
         for key, value in data.items():
             # Sanitize key
@@ -205,34 +344,16 @@ def sanitize_log_data(data: Any, max_depth: int = 5, current_depth: int = 0) ->
         
         return sanitized
     
-    elif isinstance(data, (list, tuple)):
+    elif data_type is list or data_type is tuple:
         return [sanitize_log_data(item, max_depth, current_depth + 1) for item in data[:100]]  # Limit list size
     
-    elif isinstance(data, str):
-        # Limit string length and sanitize
-        limited_str = data[:1000]  # Limit to 1000 characters
-        
-        # Check for sensitive patterns
-        for pattern in COMPILED_SENSITIVE_PATTERNS:
-            if pattern.search(limited_str):
-                return "[REDACTED_STRING]"
-        
-        # Basic sanitization
-        try:
-            return sanitize_content(limited_str, max_length=1000)
-        except Exception:
-            return "[SANITIZATION_FAILED]"
-    
     elif isinstance(data, Path):
-        # Sanitize file paths
+        # Concrete paths are PosixPath/WindowsPath subclasses, so match by isinstance
         path_str = str(data)
         if any(sensitive in path_str.lower() for sensitive in ['password', 'secret', 'key', 'token']):
             return "[REDACTED_PATH]"
         return path_str[:500]  # Limit path length
     
-    elif isinstance(data, (int, float, bool)) or data is None:
-        return data
-    
     else:
         # Convert other types to string and sanitize
         try:
@@ -291,6 +412,55 @@ def log_input_validation(input_type: str,
     log_security_event("input_validation", details, severity)
 
 
+class SecurityEventBatch:
+    """
+    Collect one operation's security events and log them as a single record.
+    
+    Used as a context manager; details added inside the block are merged
+    into one log_security_event call on exit, with a "success" flag telling
+    whether the block completed without raising.
+    
+    Example:
+        with SecurityEventBatch("prd_generation") as batch:
+            batch.validated("user_input")
+            batch.add("user_input_length", len(user_input))
+    """
+    
+    def __init__(self, event_type: str, severity: str = "INFO", logger_name: str = "security") -> None:
+        """Initialize an empty batch for the given event type."""
+        self.event_type = event_type
+        self.severity = severity
+        self.logger_name = logger_name
+        self.details: Dict[str, Any] = {}
+        self._validated_inputs: List[str] = []
+    
+    def add(self, key: str, value: Any) -> None:
+        """Record one detail of the event."""
+        self.details[key] = value
+    
+    def update(self, details: Dict[str, Any]) -> None:
+        """Record several details of the event."""
+        self.details.update(details)
+    
+    def validated(self, input_type: str) -> None:
+        """Record that an input passed validation."""
+        self._validated_inputs.append(input_type)
+    
+    def __enter__(self) -> "SecurityEventBatch":
+        return self
+    
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc: Optional[BaseException],
+                 tb: Optional[TracebackType]) -> None:
+        details = dict(self.details)
+        if self._validated_inputs:
+            details["validated_inputs"] = self._validated_inputs
+        details["success"] = exc_type is None
+        
+        log_security_event(self.event_type, details, self.severity, self.logger_name)
+
+
 def log_template_processing(template_name: str,
                            operation: str,
                            success: bool = True,
@@ -330,12 +500,15 @@ def setup_secure_logging(log_level: str = "INFO",
         max_log_size: Maximum log file size before rotation
         backup_count: Number of backup log files to keep
     """
-    import logging.handlers
+    global _queue_listener
     
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
+    # Stop a previously started listener so pending records are flushed
+    _stop_queue_listener()
+    
     # Clear existing handlers
     root_logger.handlers.clear()
     
@@ -345,12 +518,13 @@ def setup_secure_logging(log_level: str = "INFO",
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    # Console handler
-    console_handler = logging.StreamHandler()
+    # Console handler; batches stderr writes instead of one per record
+    console_handler = _BatchingStderrHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    sink_handlers: List[logging.Handler] = [console_handler]
     
     # File handler with rotation if specified
+    file_error = None
     if log_file:
         try:
             log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -361,15 +535,42 @@ def setup_secure_logging(log_level: str = "INFO",
                 backupCount=backup_count
             )
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            sink_handlers.append(file_handler)
             
             # Set secure permissions on log file
             try:
                 log_file.chmod(0o600)  # Owner read/write only
             except Exception:
                 pass  # Ignore permission errors
-                
+        
         except Exception as e:
-            logging.warning(f"Failed to setup file logging: {e}")
+            file_error = e
+    
+    # Callers only enqueue records; formatting and I/O happen on the
+    # listener's background thread so log bursts don't block the caller.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *sink_handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    
+    if file_error is not None:
+        logging.warning(f"Failed to setup file logging: {file_error}")
     
     logging.info("Secure logging configured")
+
+
+def _stop_queue_listener() -> None:
+    """Stop the background log listener, flushing any queued records."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
@@ -5,9 +5,13 @@ This module provides functions to safely handle file paths and prevent
 path traversal attacks.
 """
 
+import errno
+import functools
 import os
+import re
+import stat
 from pathlib import Path
-from typing import Optional, Union
+from typing import BinaryIO, Optional, Set, Tuple, Union
 import logging
 
 from ..exceptions import ValidationError, ResourceAccessError
@@ -15,39 +19,137 @@ from ..exceptions import ValidationError, ResourceAccessError
 
 logger = logging.getLogger(__name__)
 
+# Null bytes and control characters except tab, newline and carriage return
+_CTRL_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
 
-def normalize_path(path: Union[str, Path]) -> Path:
+# Flags for probing a file: never follow a final symlink, don't leak the fd
+# to child processes and don't block on FIFOs. Missing flags (e.g. on
+# Windows) degrade to 0.
+_PROBE_OPEN_FLAGS = (
+    os.O_RDONLY
+    | getattr(os, 'O_NOFOLLOW', 0)
+    | getattr(os, 'O_CLOEXEC', 0)
+    | getattr(os, 'O_NONBLOCK', 0)
+)
+
+# Path components rejected wherever a user-supplied path is validated
+_DANGEROUS_PARTS = frozenset({'..', '~', '$'})
+
+# Temp directories already created by get_safe_temp_path
+_ENSURED_TEMP_DIRS: Set[Path] = set()
+
+
+def normalize_path(path: Union[str, Path],
+                   allow_symlinks: bool = False,
+                   base_directory: Optional[Path] = None) -> Path:
     """
     Normalize a path to prevent traversal attacks.
     
+    Symlinks are only looked for below the trust root: the base directory,
+    or the current directory when none is given. The root itself and its
+    ancestors may be symlinks (/var -> /private/var on macOS, a symlinked
+    home or project directory), since they are not under the caller's
+    control.
+    
     Args:
         path: Path to normalize
+        allow_symlinks: Whether symlinks may appear in the path
+        base_directory: Directory below which symlinks are rejected
         
     Returns:
         Normalized Path object
         
     Raises:
-        ValidationError: If path is invalid
+        ValidationError: If path is invalid or traverses a symlink
     """
     if not path:
         raise ValidationError("path", ["Path cannot be empty"])
     
     try:
-        # Convert to Path object and resolve
-        if isinstance(path, str):
-            path_obj = Path(path)
-        else:
-            path_obj = path
+        path_str = os.fspath(path)
         
-        # Resolve to absolute path to handle .. and . components
-        normalized = path_obj.resolve()
+        # resolve() silently follows symlinks, so inspect the raw components
+        # with lstat first; checking is_symlink() afterwards would be useless.
+        # This walk runs on every call: the filesystem can change between
+        # validations, so its outcome must never come from the cache.
+        if allow_symlinks:
+            return Path(path_str).resolve()
+        _reject_symlinks(Path(path_str), base_directory or Path.cwd())
         
-        return normalized
+        # resolve() is cwd-dependent for relative paths, so the cwd is part
+        # of the cache key
+        return _resolve_cached(path_str, os.getcwd())
         
     except (OSError, ValueError) as e:
         raise ValidationError("path", [f"Invalid path: {str(e)}"])
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve_cached(path_str: str, cwd: str) -> Path:
+    """
+    Resolve a checked path, caching the result for repeated validations.
+    
+    The same template, output and reference paths are validated several
+    times per generation run; the cache turns repeats into a dict lookup.
+    Callers must have checked the part of the path below its trust root
+    for symlinks first, so only trusted ancestors can hold stale results.
+    """
+    # Resolve to absolute path to handle .. and . components
+    return Path(path_str).resolve()
+
+
+def _reject_symlinks(path_obj: Path, root: Path) -> None:
+    """
+    Raise if a component of the path below the trust root is a symlink.
+    
+    The walk goes up from the path until it reaches the root, recognised by
+    inode so that a root reached through a symlinked ancestor still counts.
+    A path that never reaches the root is not under it; its symlinks are
+    left to the caller's containment check on the resolved path.
+    Components that do not exist (yet) are skipped.
+    
+    Raises:
+        ValidationError: If a symlink is found below the root
+    """
+    root_st = os.stat(root)
+    root_id = (root_st.st_dev, root_st.st_ino)
+    
+    symlink: Optional[Path] = None
+    for component in (path_obj, *path_obj.parents):
+        try:
+            st = os.lstat(component)
+            if stat.S_ISLNK(st.st_mode):
+                # The root may itself be named through a symlink
+                st = os.stat(component)
+                if (st.st_dev, st.st_ino) == root_id:
+                    break
+                symlink = symlink or component
+                continue
+        except FileNotFoundError:
+            continue
+        
+        if (st.st_dev, st.st_ino) == root_id:
+            break
+    else:
+        return
+    
+    if symlink is not None:
+        logger.warning(f"Symlink found in path: {symlink}")
+        raise ValidationError("path", [f"Symlink not allowed: {symlink}"])
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_base(base: Path) -> Path:
+    """
+    Resolve a base directory, caching the result.
+    
+    Base directories are fixed for the lifetime of the server, so the
+    realpath walk only needs to happen once per directory. Callers pass
+    an absolute path so the cache key does not depend on the cwd.
+    """
+    return base.resolve()
+
+
 def is_safe_path(path: Union[str, Path], 
                 base_directory: Optional[Path] = None,
                 allow_absolute: bool = False) -> bool:
@@ -63,41 +165,41 @@ def is_safe_path(path: Union[str, Path],
         True if path is safe, False otherwise
     """
     try:
-        normalized = normalize_path(path)
+        # Stringify once; every check below works from these two strings
+        path_str = os.fspath(path)
+        
+        # Check the raw components; resolving removes '..' before it can be seen
+        component = find_dangerous_component(path_str)
+        if component:
+            logger.warning(f"Dangerous path component found: {component}")
+            return False
+        
+        normalized = normalize_path(path_str, base_directory=base_directory)
+        norm_str = os.fspath(normalized)
         
         # Check if absolute path is allowed
         if normalized.is_absolute() and not allow_absolute:
             if not base_directory:
-                logger.warning(f"Absolute path not allowed: {normalized}")
+                logger.warning(f"Absolute path not allowed: {norm_str}")
                 return False
         
         # If base directory is specified, ensure path is within it
         if base_directory:
             try:
-                base_resolved = base_directory.resolve()
+                base_resolved = _resolve_base(base_directory.absolute())
                 
-                # Check if the normalized path starts with base directory
-                if not str(normalized).startswith(str(base_resolved)):
-                    logger.warning(f"Path outside base directory: {normalized} not in {base_resolved}")
+                # Check if the normalized path is inside the base directory
+                if not normalized.is_relative_to(base_resolved):
+                    logger.warning(f"Path outside base directory: {norm_str} not in {os.fspath(base_resolved)}")
                     return False
                     
             except (OSError, ValueError):
                 logger.warning(f"Could not resolve base directory: {base_directory}")
                 return False
         
-        # Check for dangerous path components
-        path_parts = normalized.parts
-        dangerous_parts = {'.', '..', '~'}
-        
-        for part in path_parts:
-            if part in dangerous_parts:
-                logger.warning(f"Dangerous path component found: {part}")
-                return False
-        
         # Check for null bytes and control characters
-        path_str = str(normalized)
-        if '\x00' in path_str or any(ord(c) < 32 for c in path_str if c not in '\t\n\r'):
-            logger.warning(f"Path contains invalid characters: {path_str}")
+        if _CTRL_RE.search(norm_str):
+            logger.warning(f"Path contains invalid characters: {norm_str}")
             return False
         
         return True
@@ -107,6 +209,24 @@ def is_safe_path(path: Union[str, Path],
         return False
 
 
+def find_dangerous_component(path: Union[str, Path]) -> Optional[str]:
+    """
+    Find a dangerous component in an unresolved path.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        An offending component, or None if the path is clean
+    """
+    parts = Path(path).parts
+    
+    # One hashed pass over the parts instead of a tuple scan per component
+    if _DANGEROUS_PARTS.isdisjoint(parts):
+        return None
+    return min(_DANGEROUS_PARTS.intersection(parts))
+
+
 def secure_path_join(base: Union[str, Path], *paths: Union[str, Path]) -> Path:
     """
     Safely join paths, preventing directory traversal.
@@ -145,8 +265,9 @@ def secure_path_join(base: Union[str, Path], *paths: Union[str, Path]) -> Path:
         # Normalize the final result
         final_path = result_path.resolve()
         
-        # Ensure the final path is still within the base directory
-        if not str(final_path).startswith(str(base_path)):
+        # Ensure the final path is still within the base directory; a string
+        # prefix test would accept sibling directories such as /base_evil
+        if not final_path.is_relative_to(base_path):
             raise ValidationError(
                 "joined_path",
                 ["Joined path escapes base directory"]
@@ -180,57 +301,82 @@ def validate_file_access(file_path: Union[str, Path],
         ResourceAccessError: If file cannot be safely accessed
     """
     try:
-        # Normalize and validate path
-        normalized_path = normalize_path(file_path)
-        
-        # Check if path is safe
-        if not is_safe_path(normalized_path, base_directory):
-            raise ResourceAccessError(
-                f"Unsafe file path: {file_path}",
-                str(file_path),
-                [
-                    "Use a path within the allowed directory",
-                    "Avoid using .. or . in paths",
-                    "Use relative paths when possible"
-                ]
-            )
-        
-        # Check if file exists
-        if check_exists and not normalized_path.exists():
-            raise ResourceAccessError(
-                f"File does not exist: {normalized_path}",
-                str(normalized_path),
-                [
-                    "Check if the file path is correct",
-                    "Ensure the file exists",
-                    "Verify file permissions"
-                ]
-            )
+        normalized_path = _validate_access_path(file_path, base_directory)
         
-        # Check if file is readable
-        if check_readable and normalized_path.exists():
+        # Open once and fstat the descriptor instead of separate exists/stat/open
+        # probes, so the checks apply to a single inode rather than a pathname
+        # that can be swapped between calls.
+        if check_exists or check_readable:
             try:
-                # Try to read file stats to check accessibility
-                normalized_path.stat()
-                
-                # For files, check if we can open them
-                if normalized_path.is_file():
-                    with open(normalized_path, 'rb') as f:
-                        # Just check if we can open it
-                        pass
-                        
-            except (PermissionError, OSError) as e:
+                fd = os.open(str(normalized_path), _PROBE_OPEN_FLAGS)
+            except FileNotFoundError as e:
+                if check_exists:
+                    raise _access_error(e, normalized_path)
+            except OSError as e:
+                if e.errno == errno.ELOOP or check_readable:
+                    raise _access_error(e, normalized_path)
+            else:
+                try:
+                    os.fstat(fd)
+                finally:
+                    os.close(fd)
+        
+        return normalized_path
+        
+    except ResourceAccessError:
+        raise
+    except Exception as e:
+        raise ResourceAccessError(
+            f"Error validating file access: {str(e)}",
+            str(file_path),
+            [
+                "Check if the file path is valid",
+                "Ensure proper file permissions",
+                "Verify the file system is accessible"
+            ]
+        )
+
+
+def validate_and_open(file_path: Union[str, Path],
+                      base_directory: Optional[Path] = None) -> Tuple[Path, BinaryIO]:
+    """
+    Validate a file and open it for reading in one step.
+    
+    The returned file object is the descriptor that passed validation, so
+    callers read exactly what was checked and never reopen the path.
+    
+    Args:
+        file_path: Path to the file
+        base_directory: Base directory to restrict access to
+        
+    Returns:
+        Tuple of the validated Path and an open binary file object; the
+        caller is responsible for closing it
+        
+    Raises:
+        ResourceAccessError: If file cannot be safely accessed
+    """
+    try:
+        normalized_path = _validate_access_path(file_path, base_directory)
+        
+        try:
+            fd = os.open(str(normalized_path), _PROBE_OPEN_FLAGS)
+        except OSError as e:
+            raise _access_error(e, normalized_path)
+        
+        try:
+            if not stat.S_ISREG(os.fstat(fd).st_mode):
                 raise ResourceAccessError(
-                    f"Cannot access file: {normalized_path}",
+                    f"Not a regular file: {normalized_path}",
                     str(normalized_path),
-                    [
-                        "Check file permissions",
-                        "Ensure you have read access to the file",
-                        "Verify the file is not locked by another process"
-                    ]
+                    ["Reference regular files only"]
                 )
-        
-        return normalized_path
+            # O_NONBLOCK only guards the open against FIFOs; reads should block
+            os.set_blocking(fd, True)
+            return normalized_path, os.fdopen(fd, 'rb')
+        except BaseException:
+            os.close(fd)
+            raise
         
     except ResourceAccessError:
         raise
@@ -246,37 +392,98 @@ def validate_file_access(file_path: Union[str, Path],
         )
 
 
+def _validate_access_path(file_path: Union[str, Path],
+                          base_directory: Optional[Path]) -> Path:
+    """Normalize a path and raise if it is not safe to access."""
+    normalized_path = normalize_path(file_path, base_directory=base_directory)
+    
+    if not is_safe_path(normalized_path, base_directory):
+        raise ResourceAccessError(
+            f"Unsafe file path: {file_path}",
+            str(file_path),
+            [
+                "Use a path within the allowed directory",
+                "Avoid using .. or . in paths",
+                "Use relative paths when possible"
+            ]
+        )
+    
+    return normalized_path
+
+
+def _access_error(error: OSError, path: Path) -> ResourceAccessError:
+    """Translate a failed open of a validated path into a ResourceAccessError."""
+    if isinstance(error, FileNotFoundError):
+        return ResourceAccessError(
+            f"File does not exist: {path}",
+            str(path),
+            [
+                "Check if the file path is correct",
+                "Ensure the file exists",
+                "Verify file permissions"
+            ]
+        )
+    
+    if error.errno == errno.ELOOP:
+        return ResourceAccessError(
+            f"Symlink rejected: {path}",
+            str(path),
+            [
+                "Reference the target file directly",
+                "Avoid symlinks inside reference folders"
+            ]
+        )
+    
+    return ResourceAccessError(
+        f"Cannot access file: {path}",
+        str(path),
+        [
+            "Check file permissions",
+            "Ensure you have read access to the file",
+            "Verify the file is not locked by another process"
+        ]
+    )
+
+
 def get_safe_temp_path(base_temp_dir: Optional[Path] = None, 
                       prefix: str = "docgen_",
                       suffix: str = "") -> Path:
     """
     Get a safe temporary file path.
     
+    The file is created atomically (O_CREAT | O_EXCL, mode 0600) so the
+    name cannot be claimed by another process or pre-planted as a symlink.
+    
     Args:
         base_temp_dir: Base temporary directory
         prefix: Filename prefix
         suffix: Filename suffix
         
     Returns:
-        Safe temporary file path
+        Path of a newly created, empty temporary file
     """
     import tempfile
-    import uuid
     
     if base_temp_dir:
         temp_dir = base_temp_dir
     else:
         temp_dir = Path(tempfile.gettempdir())
     
-    # Create a unique filename
-    unique_id = str(uuid.uuid4())[:8]
-    filename = f"{prefix}{unique_id}{suffix}"
-    
     # Ensure the temp directory exists and is safe
-    temp_dir = normalize_path(temp_dir)
-    temp_dir.mkdir(parents=True, exist_ok=True)
+    temp_dir = normalize_path(temp_dir, allow_symlinks=True)  # system temp dir may be a symlink
+    if temp_dir not in _ENSURED_TEMP_DIRS:
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_TEMP_DIRS.add(temp_dir)
+    
+    try:
+        fd, temp_path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=temp_dir)
+    except FileNotFoundError:
+        # The directory was removed after it was cached
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=temp_dir)
+    os.close(fd)
     
-    return temp_dir / filename
+    return Path(temp_path)
 
 
 def cleanup_temp_files(temp_paths: list, ignore_errors: bool = True) -> None:
@@ -287,18 +494,25 @@ def cleanup_temp_files(temp_paths: list, ignore_errors: bool = True) -> None:
         temp_paths: List of temporary file paths to cleanup
         ignore_errors: Whether to ignore cleanup errors
     """
+    # Cleaned-up paths must not be served from the normalization cache
+    _resolve_cached.cache_clear()
+    _ENSURED_TEMP_DIRS.clear()
+    
     for temp_path in temp_paths:
         try:
             if isinstance(temp_path, (str, Path)):
                 path_obj = Path(temp_path)
-                if path_obj.exists():
-                    if path_obj.is_file():
-                        path_obj.unlink()
-                    elif path_obj.is_dir():
-                        import shutil
-                        shutil.rmtree(path_obj)
-                    
-                    logger.debug(f"Cleaned up temporary file: {path_obj}")
+                try:
+                    st = os.lstat(path_obj)
+                except FileNotFoundError:
+                    continue
+                
+                if stat.S_ISDIR(st.st_mode):
+                    _fast_rmtree(path_obj)
+                else:
+                    path_obj.unlink()
+                
+                logger.debug(f"Cleaned up temporary file: {path_obj}")
                     
         except Exception as e:
             if not ignore_errors:
@@ -306,27 +520,53 @@ def cleanup_temp_files(temp_paths: list, ignore_errors: bool = True) -> None:
             logger.warning(f"Failed to cleanup temporary file {temp_path}: {e}")
 
 
-def restrict_file_permissions(file_path: Union[str, Path], 
+def _fast_rmtree(path: Path) -> None:
+    """
+    Recursively delete a directory tree.
+    
+    Unlike shutil.rmtree this never stats entries: the file type comes from
+    the directory listing itself. Symlinks are unlinked, never followed.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(Path(entry.path))
+            else:
+                os.unlink(entry.path)
+    
+    os.rmdir(path)
+
+
+def restrict_file_permissions(fd_or_path: Union[int, str, Path], 
                             owner_only: bool = True) -> None:
     """
     Restrict file permissions for security.
     
+    The mode is applied with fchmod on a descriptor, so it lands on the inode
+    that was opened; a path is opened without following symlinks first.
+    
     Args:
-        file_path: Path to the file
+        fd_or_path: Open file descriptor or path to the file
         owner_only: Whether to restrict access to owner only
     """
+    # Owner read/write only (600), or owner read/write, group/others read (644)
+    mode = 0o600 if owner_only else 0o644
+    
     try:
-        path_obj = Path(file_path)
-        
-        if owner_only:
-            # Set permissions to owner read/write only (600)
-            path_obj.chmod(0o600)
+        if isinstance(fd_or_path, int):
+            os.fchmod(fd_or_path, mode)
+        elif not hasattr(os, 'fchmod'):
+            # Windows: no fchmod and no symlink-following chmod concerns
+            os.chmod(fd_or_path, mode)
         else:
-            # Set permissions to owner read/write, group/others read (644)
-            path_obj.chmod(0o644)
+            fd = os.open(fd_or_path, _PROBE_OPEN_FLAGS)
+            try:
+                os.fchmod(fd, mode)
+            finally:
+                os.close(fd)
             
-        logger.debug(f"Set secure permissions for: {path_obj}")
+        logger.debug(f"Set secure permissions for: {fd_or_path}")
         
     except Exception as e:
-        logger.warning(f"Failed to set file permissions for {file_path}: {e}")
+        logger.warning(f"Failed to set file permissions for {fd_or_path}: {e}")
         # Don't raise exception as this might not be critical
@@ -5,13 +5,21 @@ This module provides functions to validate and sanitize user inputs
 to prevent injection attacks and ensure data integrity.
 """
 
+import os
 import re
 import html
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Collection, Dict, List, Optional, Union
 import logging
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 from ..exceptions import ValidationError
+from .path_security import _CTRL_RE, find_dangerous_component
 
 
 logger = logging.getLogger(__name__)
@@ -34,6 +42,73 @@ DANGEROUS_PATTERNS = [
     r'os\.',                      # OS module calls
 ]
 
+# All dangerous patterns as one alternation so input is scanned in a single
+# pass; group "p<N>" identifies the DANGEROUS_PATTERNS entry that matched.
+_DANGEROUS_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(DANGEROUS_PATTERNS)),
+    re.IGNORECASE | re.DOTALL
+)
+
+# Template names: alphanumeric, underscore, hyphen and dot
+_TEMPLATE_CONFIG_RE = re.compile(r'^[a-zA-Z0-9_.-]+$')
+
+# Every DANGEROUS_PATTERNS entry contains at least one of <, :, (, _, . or o,
+# so text with none of them (and no control characters) is returned unchanged
+# by sanitize_content without running the full scan.
+_TRIGGER_CHARS_RE = re.compile(r'[<:(_.o\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', re.IGNORECASE)
+_TRIGGER_SCAN_MAX_LENGTH = 64
+
+
+def _compile_hyperscan_database() -> Optional[Any]:
+    """Compile DANGEROUS_PATTERNS into a Hyperscan block-mode database if available."""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SINGLEMATCH
+        database.compile(
+            expressions=[pattern.encode() for pattern in DANGEROUS_PATTERNS],
+            ids=list(range(len(DANGEROUS_PATTERNS))),
+            elements=len(DANGEROUS_PATTERNS),
+            flags=[flags] * len(DANGEROUS_PATTERNS)
+        )
+        return database
+    except Exception as e:
+        logger.warning(f"Hyperscan unavailable, using regex scanning: {e}")
+        return None
+
+
+# Linear-time DFA scanner for untrusted content; None falls back to _DANGEROUS_RE
+_HS_DATABASE = _compile_hyperscan_database()
+
+
+def _find_dangerous_pattern(text: str) -> Optional[str]:
+    """
+    Find the first dangerous pattern present in text.
+    
+    Args:
+        text: Text to scan
+        
+    Returns:
+        The matching DANGEROUS_PATTERNS entry, or None if the text is clean
+    """
+    if _HS_DATABASE is not None:
+        hits: List[int] = []
+        
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+            hits.append(pattern_id)
+        
+        _HS_DATABASE.scan(text.encode('utf-8', 'ignore'), match_event_handler=on_match)
+        return DANGEROUS_PATTERNS[hits[0]] if hits else None
+    
+    match = _DANGEROUS_RE.search(text)
+    if match is None:
+        return None
+    # Every alternative is a named group, so a match always has one
+    assert match.lastgroup is not None
+    return DANGEROUS_PATTERNS[int(match.lastgroup[1:])]
+
 
 def validate_user_input(user_input: str, max_length: int = MAX_INPUT_LENGTH) -> str:
     """
@@ -68,21 +143,20 @@ def validate_user_input(user_input: str, max_length: int = MAX_INPUT_LENGTH) ->
         )
     
     # Check for dangerous patterns
-    for pattern in DANGEROUS_PATTERNS:
-        if re.search(pattern, user_input, re.IGNORECASE):
-            logger.warning(f"Dangerous pattern detected in user input: {pattern}")
-            raise ValidationError(
-                "user_input",
-                ["Input contains potentially dangerous content"]
-            )
-    
-    # Sanitize HTML entities
-    sanitized = html.escape(user_input)
+    dangerous_pattern = _find_dangerous_pattern(user_input)
+    if dangerous_pattern:
+        logger.warning(f"Dangerous pattern detected in user input: {dangerous_pattern}")
+        raise ValidationError(
+            "user_input",
+            ["Input contains potentially dangerous content"]
+        )
     
-    # Remove null bytes and other control characters
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', sanitized)
+    # Remove null bytes and other control characters, then escape once;
+    # escaping cannot introduce control characters or edge whitespace
+    cleaned = _CTRL_RE.sub('', user_input).strip()
     
-    return sanitized.strip()
+    # Sanitize HTML entities
+    return html.escape(cleaned)
 
 
 def validate_file_path(file_path: Union[str, Path], 
@@ -119,34 +193,42 @@ def validate_file_path(file_path: Union[str, Path],
     else:
         path = file_path
     
-    # Check for dangerous path components (but allow . for current directory)
-    dangerous_components = ['..', '~', '$']
-    path_str = str(path)
+    # Stringify once for the character and component checks
+    path_str = os.fspath(path)
     
-    for component in dangerous_components:
-        if component in path.parts:
-            raise ValidationError(
-                "file_path",
-                [f"Path contains dangerous component: {component}"]
-            )
+    # Check for null bytes and other dangerous characters
+    if _CTRL_RE.search(path_str):
+        raise ValidationError(
+            "file_path",
+            ["Path contains invalid characters"]
+        )
+    
+    # Component rules live in path_security so both validation entry points
+    # reject the same components
+    component = find_dangerous_component(path_str)
+    if component:
+        raise ValidationError(
+            "file_path",
+            [f"Path contains dangerous component: {component}"]
+        )
     
-    # Check for absolute paths that might escape sandbox
-    if path.is_absolute() and base_directory:
+    # Only absolute paths can escape the sandbox; they are resolved, following
+    # symlinks, and must land inside the base directory
+    if base_directory and path.is_absolute():
         try:
-            # Resolve both paths and check if file path is within base directory
             resolved_path = path.resolve()
             resolved_base = base_directory.resolve()
-            
-            if not str(resolved_path).startswith(str(resolved_base)):
-                raise ValidationError(
-                    "file_path",
-                    ["Path is outside allowed directory"]
-                )
         except (OSError, ValueError) as e:
             raise ValidationError(
                 "file_path",
                 [f"Invalid path: {str(e)}"]
             )
+        
+        if not resolved_path.is_relative_to(resolved_base):
+            raise ValidationError(
+                "file_path",
+                ["Path is outside allowed directory"]
+            )
     
     # Validate file extension if specified
     if allowed_extensions:
@@ -156,13 +238,6 @@ def validate_file_path(file_path: Union[str, Path],
                 [f"File extension not allowed: {path.suffix}. Allowed: {allowed_extensions}"]
             )
     
-    # Check for null bytes and other dangerous characters
-    if '\x00' in path_str or any(ord(c) < 32 for c in path_str if c not in '\t\n\r'):
-        raise ValidationError(
-            "file_path",
-            ["Path contains invalid characters"]
-        )
-    
     return path
 
 
@@ -195,7 +270,7 @@ def validate_template_config(template_config: str) -> str:
         )
     
     # Allow alphanumeric, underscore, hyphen, and dot
-    if not re.match(r'^[a-zA-Z0-9_.-]+$', template_config):
+    if not _TEMPLATE_CONFIG_RE.match(template_config):
         raise ValidationError(
             "template_config",
             ["Template configuration contains invalid characters. Use only letters, numbers, underscore, hyphen, and dot."]
@@ -250,28 +325,32 @@ def sanitize_content(content: str, max_length: int = MAX_INPUT_LENGTH) -> str:
             [f"Content too long: {len(content)} characters (max: {max_length})"]
         )
     
+    # Short dict keys and values rarely contain any trigger character
+    if len(content) < _TRIGGER_SCAN_MAX_LENGTH and not _TRIGGER_CHARS_RE.search(content):
+        return content
+    
     # Remove null bytes and control characters except newlines and tabs
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', content)
+    sanitized = _CTRL_RE.sub('', content)
     
     # Check for dangerous patterns in content
-    for pattern in DANGEROUS_PATTERNS:
-        if re.search(pattern, sanitized, re.IGNORECASE):
-            logger.warning(f"Dangerous pattern detected in content: {pattern}")
-            # Remove the dangerous pattern instead of rejecting entirely
-            sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE)
+    dangerous_pattern = _find_dangerous_pattern(sanitized)
+    if dangerous_pattern:
+        logger.warning(f"Dangerous pattern detected in content: {dangerous_pattern}")
+        # Remove the dangerous patterns instead of rejecting entirely
+        sanitized = _DANGEROUS_RE.sub('', sanitized)
     
     return sanitized
 
 
 def validate_dict_input(data: Dict[str, Any], 
-                       allowed_keys: Optional[List[str]] = None,
+                       allowed_keys: Optional[Collection[str]] = None,
                        max_depth: int = 10) -> Dict[str, Any]:
     """
     Validate dictionary input for security.
     
     Args:
         data: Dictionary to validate
-        allowed_keys: List of allowed keys
+        allowed_keys: Allowed keys; pass a frozenset to skip the conversion
         max_depth: Maximum nesting depth
         
     Returns:
@@ -286,7 +365,20 @@ def validate_dict_input(data: Dict[str, Any],
             ["Input must be a dictionary"]
         )
     
-    def validate_recursive(obj: Any, depth: int = 0) -> Any:
+    # Nothing to walk or sanitize
+    if not data:
+        return {}
+    
+    # Keys are checked at every level, so make lookups O(1)
+    if allowed_keys and not isinstance(allowed_keys, (set, frozenset)):
+        allowed_keys = frozenset(allowed_keys)
+    
+    # Containers are walked with an explicit stack rather than recursion, so
+    # hostile nesting costs no interpreter frames. Each stack entry pairs a
+    # source container with the empty copy that receives its validated items.
+    stack: List[tuple] = []
+    
+    def validate_value(obj: Any, depth: int) -> Any:
         if depth > max_depth:
             raise ValidationError(
                 "dict_input",
@@ -294,26 +386,14 @@ def validate_dict_input(data: Dict[str, Any],
             )
         
         if isinstance(obj, dict):
-            validated = {}
-            for key, value in obj.items():
-                # Validate key
-                if not isinstance(key, str):
-                    raise ValidationError(
-                        "dict_input",
-                        ["Dictionary keys must be strings"]
-                    )
-                
-                if allowed_keys and key not in allowed_keys:
-                    logger.warning(f"Unexpected key in dictionary: {key}")
-                    continue  # Skip unexpected keys
-                
-                # Validate value recursively
-                validated[key] = validate_recursive(value, depth + 1)
-            
-            return validated
+            validated_dict: Dict[str, Any] = {}
+            stack.append((obj, validated_dict, depth))
+            return validated_dict
         
         elif isinstance(obj, list):
-            return [validate_recursive(item, depth + 1) for item in obj]
+            validated_list: List[Any] = []
+            stack.append((obj, validated_list, depth))
+            return validated_list
         
         elif isinstance(obj, str):
             return sanitize_content(obj)
@@ -325,4 +405,26 @@ def validate_dict_input(data: Dict[str, Any],
             # Convert other types to string and sanitize
             return sanitize_content(str(obj))
     
-    return validate_recursive(data)
+    result: Dict[str, Any] = validate_value(data, 0)
+    
+    while stack:
+        source, validated, depth = stack.pop()
+        
+        if isinstance(validated, dict):
+            for key, value in source.items():
+                # Validate key
+                if not isinstance(key, str):
+                    raise ValidationError(
+                        "dict_input",
+                        ["Dictionary keys must be strings"]
+                    )
+                
+                if allowed_keys and key not in allowed_keys:
+                    logger.warning(f"Unexpected key in dictionary: {key}")
+                    continue  # Skip unexpected keys
+                
+                validated[key] = validate_value(value, depth + 1)
+        else:
+            validated.extend(validate_value(item, depth + 1) for item in source)
+    
+    return result
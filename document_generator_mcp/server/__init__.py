@@ -4,10 +4,20 @@ MCP server implementation for the Document Generator.
 This module contains the FastMCP server setup and tool registration.
 """
 
-from .mcp_server import DocumentGeneratorMCPServer
-from .tools import register_tools
+from typing import Any
 
 __all__ = [
     "DocumentGeneratorMCPServer",
     "register_tools",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so the entry point can start without the MCP stack
+    if name == "DocumentGeneratorMCPServer":
+        from .mcp_server import DocumentGeneratorMCPServer
+        return DocumentGeneratorMCPServer
+    if name == "register_tools":
+        from .tools import register_tools
+        return register_tools
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,86 @@
+"""
+Admission control for concurrent MCP tool calls.
+
+This module provides a concurrency cap for tool execution that, unlike
+asyncio.Semaphore, can be resized while calls are in flight.
+"""
+
+import asyncio
+from types import TracebackType
+from typing import Optional, Type
+
+
+class AdmissionController:
+    """
+    Limit how many tool calls run at once.
+    
+    An explicit counter guarded by an asyncio.Condition is used instead of a
+    Semaphore so the cap can be raised or lowered at runtime without touching
+    private state; lowering it lets in-flight calls finish and only delays
+    new admissions.
+    """
+    
+    def __init__(self, max_concurrent: int):
+        """Initialize the controller with a concurrency cap."""
+        if max_concurrent <= 0:
+            raise ValueError(f"max_concurrent must be positive, got {max_concurrent}")
+        
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        # Created on first use so it binds to the running event loop
+        self._condition: Optional[asyncio.Condition] = None
+    
+    @property
+    def max_concurrent(self) -> int:
+        """Current concurrency cap."""
+        return self._max_concurrent
+    
+    @property
+    def active(self) -> int:
+        """Number of calls currently admitted."""
+        return self._active
+    
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+    
+    async def acquire(self) -> None:
+        """Wait until a slot is free and take it."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._active < self._max_concurrent)
+            self._active += 1
+    
+    async def release(self) -> None:
+        """Give a slot back and wake one waiter."""
+        # Free the slot before waiting for the lock: a caller cancelled while
+        # the lock is contended must not leak it. The wake-up is shielded so
+        # it still reaches a waiter if that happens.
+        self._active -= 1
+        await asyncio.shield(self._notify_one())
+    
+    async def _notify_one(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            condition.notify(1)
+    
+    async def set_max_concurrent(self, max_concurrent: int) -> None:
+        """Resize the cap, waking waiters that may now be admitted."""
+        if max_concurrent <= 0:
+            raise ValueError(f"max_concurrent must be positive, got {max_concurrent}")
+        
+        condition = self._get_condition()
+        async with condition:
+            self._max_concurrent = max_concurrent
+            condition.notify_all()
+    
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self,
+                        exc_type: Optional[Type[BaseException]],
+                        exc: Optional[BaseException],
+                        tb: Optional[TracebackType]) -> None:
+        await self.release()
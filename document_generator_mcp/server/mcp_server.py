@@ -7,15 +7,17 @@ tool registration, and transport support.
 
 import logging
 import sys
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Dict, Any
-import argparse
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NoReturn, Optional, Tuple
 
-from mcp.server.fastmcp import FastMCP
+if TYPE_CHECKING:
+    from ..services.document_generator import DocumentGeneratorService
+    from ..templates.manager import TemplateManager
 
-from ..services.document_generator import DocumentGeneratorService
-from ..templates.manager import TemplateManager
-from .tools import register_tools
+# The MCP stack, services and templates are imported where they are first
+# needed so that importing this module (e.g. for --help) stays cheap.
 
 
 logger = logging.getLogger(__name__)
@@ -30,7 +32,10 @@ class DocumentGeneratorMCPServer:
                  server_name: str = "Document Generator",
                  server_version: str = "0.1.0"):
         """Initialize the MCP server."""
-        self.output_directory = output_directory or Path.cwd()
+        from mcp.server.fastmcp import FastMCP
+        
+        self._base_dir = Path.cwd()
+        self.output_directory = output_directory or self._base_dir
         self.custom_templates_path = custom_templates_path
         self.server_name = server_name
         self.server_version = server_version
@@ -38,39 +43,70 @@ class DocumentGeneratorMCPServer:
         # Initialize FastMCP server
         self.mcp = FastMCP(server_name)
         
-        # Initialize services
-        self._initialize_services()
+        # Services are built on first access and tools and resources are
+        # registered by _boot() once a transport starts, so construction
+        # (e.g. just for get_server_info) stays cheap
+        self._booted = False
+    
+    async def _boot(self) -> None:
+        """Register tools and resources, once."""
+        if self._booted:
+            return
         
-        # Register tools
+        # Register tools; services are built as the tools are wired to them
         self._register_tools()
         
         # Register resources
         self._register_resources()
+        
+        self._booted = True
+    
+    @cached_property
+    def template_manager(self) -> "TemplateManager":
+        """Template manager, built on first access; shared with the template tools."""
+        from ..templates.manager import TemplateManager
+        
+        try:
+            # Parses every template up front
+            return TemplateManager(self.custom_templates_path)
+        except Exception as e:
+            logger.error(f"Failed to initialize template manager: {e}")
+            raise
     
-    def _initialize_services(self) -> None:
-        """Initialize all required services."""
+    @cached_property
+    def document_service(self) -> "DocumentGeneratorService":
+        """Document generator service, built on first access."""
+        from ..services.document_generator import DocumentGeneratorService
+        
         try:
-            # Initialize template manager
-            template_manager = TemplateManager(self.custom_templates_path)
-            
-            # Initialize document generator service
-            self.document_service = DocumentGeneratorService(
-                template_manager=template_manager,
+            service = DocumentGeneratorService(
+                template_manager=self.template_manager,
                 output_directory=self.output_directory
             )
-            
             logger.info("Services initialized successfully")
-            
+            return service
         except Exception as e:
             logger.error(f"Failed to initialize services: {e}")
             raise
     
     def _register_tools(self) -> None:
         """Register all MCP tools."""
+        from ..security import get_secure_defaults
+        from .admission import AdmissionController
+        from .tools import register_tools
+        
         try:
-            register_tools(self.mcp, self.document_service)
+            # Kept on the server so the cap can be resized at runtime
+            self.admission = AdmissionController(get_secure_defaults().max_concurrent_requests)
+            register_tools(
+                self.mcp,
+                self.document_service,
+                base_dir=self._base_dir,
+                admission=self.admission,
+                template_manager=self.template_manager
+            )
             logger.info("Tools registered successfully")
-            
+        
         except Exception as e:
             logger.error(f"Failed to register tools: {e}")
             raise
@@ -93,6 +129,8 @@ class DocumentGeneratorMCPServer:
         """Run the server with STDIO transport."""
         logger.info("Starting MCP server with STDIO transport")
         
+        await self._boot()
+        
         try:
             # Use FastMCP's built-in stdio runner
             await self.mcp.run_stdio_async()
@@ -149,43 +187,91 @@ def create_server_from_config(config: Dict[str, Any]) -> DocumentGeneratorMCPSer
 
 def setup_logging(log_level: str = "INFO") -> None:
     """Setup logging configuration."""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stderr)
-        ]
-    )
+    from ..security.logging_security import setup_secure_logging
+    
+    # Records go through the shared queue listener and reach stderr in
+    # batched writes rather than one write per record
+    setup_secure_logging(log_level)
 
 
-async def main() -> None:
-    """Main entry point for the MCP server."""
-    parser = argparse.ArgumentParser(description="Document Generator MCP Server")
-    parser.add_argument(
-        "--transport", 
-        choices=["stdio"], 
-        default="stdio",
-        help="Transport protocol to use (currently only stdio is supported)"
-    )
+_USAGE = """usage: document-generator-mcp [-h] [--transport {stdio}] [--output-dir OUTPUT_DIR]
+                              [--templates-dir TEMPLATES_DIR]
+                              [--log-level {DEBUG,INFO,WARNING,ERROR}]"""
 
-    parser.add_argument(
-        "--output-dir", 
-        type=Path,
-        help="Output directory for generated documents"
-    )
-    parser.add_argument(
-        "--templates-dir", 
-        type=Path,
-        help="Directory containing custom templates"
-    )
-    parser.add_argument(
-        "--log-level", 
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"], 
-        default="INFO",
-        help="Logging level"
-    )
+_HELP = _USAGE + """
+
+Document Generator MCP Server
+
+options:
+  -h, --help            show this help message and exit
+  --transport {stdio}   Transport protocol to use (currently only stdio is supported)
+  --output-dir OUTPUT_DIR
+                        Output directory for generated documents
+  --templates-dir TEMPLATES_DIR
+                        Directory containing custom templates
+  --log-level {DEBUG,INFO,WARNING,ERROR}
+                        Logging level"""
+
+# flag -> (attribute, converter, allowed choices, default)
+_FLAGS: Dict[str, Tuple[str, Callable[[str], Any], Optional[Tuple[str, ...]], Any]] = {
+    "--transport": ("transport", str, ("stdio",), "stdio"),
+    "--output-dir": ("output_dir", Path, None, None),
+    "--templates-dir": ("templates_dir", Path, None, None),
+    "--log-level": ("log_level", str, ("DEBUG", "INFO", "WARNING", "ERROR"), "INFO"),
+}
+
+
+def _parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parse command line arguments.
+    
+    A single pass over a small flag table; this runs on every stdio spawn
+    and avoids importing and building an argparse parser.
+    
+    Args:
+        argv: Arguments excluding the program name
+    
+    Returns:
+        Namespace with one attribute per flag
+    """
+    def fail(message: str) -> NoReturn:
+        print(f"{_USAGE}\ndocument-generator-mcp: error: {message}", file=sys.stderr)
+        sys.exit(2)
+    
+    values = {attr: default for attr, _, _, default in _FLAGS.values()}
     
-    args = parser.parse_args()
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        
+        if arg in ("-h", "--help"):
+            print(_HELP)
+            sys.exit(0)
+        
+        flag, sep, value = arg.partition("=")
+        spec = _FLAGS.get(flag)
+        if spec is None:
+            fail(f"unrecognized arguments: {arg}")
+        attr, convert, choices, _ = spec
+        
+        if not sep:
+            if i >= len(argv):
+                fail(f"argument {flag}: expected one argument")
+            value = argv[i]
+            i += 1
+        
+        if choices is not None and value not in choices:
+            choice_list = ", ".join(repr(c) for c in choices)
+            fail(f"argument {flag}: invalid choice: {value!r} (choose from {choice_list})")
+        values[attr] = convert(value)
+    
+    return SimpleNamespace(**values)
+
+
+async def main() -> None:
+    """Main entry point for the MCP server."""
+    args = _parse_args(sys.argv[1:])
     
     # Setup logging
     setup_logging(args.log_level)
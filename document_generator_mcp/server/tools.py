@@ -5,17 +5,16 @@ This module defines all the MCP tools that clients can use to interact
 with the document generation system.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple, TypeVar, cast
+import asyncio
+import functools
 import logging
+import sys
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
-from mcp import types
 
-from ..services.document_generator import DocumentGeneratorService
-from ..services.resource_analyzer import ResourceAnalyzerService
-from ..templates.manager import TemplateManager
-from ..processors.registry import get_registry
+from .admission import AdmissionController
 from ..exceptions import DocumentGeneratorError, ValidationError
 from ..models.core import PromptResult, AIGeneratedContent, ContentValidationResult
 from ..security import (
@@ -28,16 +27,204 @@ from ..security import (
     log_security_event,
     log_input_validation,
     get_secure_defaults,
+    SecurityEventBatch,
+    SecurityConfig,
 )
 
+if TYPE_CHECKING:
+    from ..services.document_generator import DocumentGeneratorService
+    from ..templates.manager import TemplateManager
+
 
 logger = get_security_logger(__name__)
 
+# Any tool function, sync or async; the decorators below preserve its signature
+_Tool = TypeVar("_Tool", bound=Callable[..., Any])
+
+
+# Default recovery suggestions for tool error responses. Tuples so they are
+# built once; each response gets its own list copy.
+_PRD_RECOVERY = (
+    "Check input parameters",
+    "Verify reference folder exists",
+    "Try with default template",
+)
+_SPEC_RECOVERY = (
+    "Check input parameters",
+    "Verify existing PRD path if provided",
+    "Verify reference folder exists",
+    "Try with default template",
+)
+_DESIGN_RECOVERY = (
+    "Check input parameters",
+    "Verify existing SPEC path if provided",
+    "Verify reference folder exists",
+    "Try with default template",
+)
+_EMPTY_FOLDER_RECOVERY = (
+    "Provide a valid folder path",
+    "Ensure folder exists and is accessible",
+)
+_ANALYSIS_RECOVERY = (
+    "Check if folder path exists",
+    "Verify folder permissions",
+    "Ensure folder contains supported file types",
+)
+_CUSTOMIZE_RECOVERY = (
+    "Check template type is valid (prd, spec, design)",
+    "Verify section customizations are properly formatted",
+    "Use list_templates to see available base templates",
+)
+_SAVE_RECOVERY = (
+    "Check that the content is valid",
+    "Verify the document type is supported",
+    "Ensure write permissions to output directory",
+)
+_VALIDATE_RECOVERY = (
+    "Check that the document type is supported",
+    "Verify the content format is correct",
+)
+
+# Keys accepted by customize_template's dictionary arguments
+_SECTION_KEYS = frozenset({'add', 'modify', 'remove'})
+_FORMATTING_KEYS = frozenset({'description', 'author', 'supports_customization'})
+
+
+# Last list_supported_formats response with the registry and version it
+# was built from
+_formats_response: Optional[Tuple[Any, int, Dict[str, Any]]] = None
+
+
+# Resource analysis and the processor registry are imported on first use;
+# most sessions call only one or two tools.
+
+@functools.lru_cache(maxsize=1)
+def _get_security_config() -> SecurityConfig:
+    """Get the security configuration, built once per process."""
+    return get_secure_defaults()
+
+
+def _tool_errors(operation: str,
+                 label: str,
+                 default_suggestions: Optional[Tuple[str, ...]] = None,
+                 validation_error: Optional[str] = None,
+                 failure_error: Optional[str] = None) -> Callable[[_Tool], _Tool]:
+    """
+    Turn exceptions raised by a tool into its error response.
+    
+    Args:
+        operation: Event name prefix used for security logging
+        label: Human-readable operation name for log messages
+        default_suggestions: Recovery suggestions used when the exception has
+            none of its own; None leaves them out of the response
+        validation_error: Client-facing message for ValidationError; None
+            treats validation errors like any other exception
+        failure_error: Client-facing message for other exceptions, which are
+            then also logged as security events; None reports str(e)
+        
+    Returns:
+        Decorator for sync or async tool functions
+    """
+    def error_response(e: Exception) -> Dict[str, Any]:
+        if validation_error is not None and isinstance(e, ValidationError):
+            log_input_validation(operation, False, e.recovery_suggestions)
+            logger.warning(f"{label} validation failed: {e}")
+            return {
+                "error": validation_error,
+                "error_type": "ValidationError",
+                "recovery_suggestions": e.recovery_suggestions
+            }
+        
+        if failure_error is not None:
+            log_security_event(f"{operation}_error", {
+                "error_type": type(e).__name__,
+                "error_message": str(e)[:200]  # Limit error message length
+            }, severity="ERROR")
+        logger.error(f"{label} failed: {e}")
+        
+        response: Dict[str, Any] = {
+            "error": failure_error if failure_error is not None else str(e),
+            "error_type": type(e).__name__
+        }
+        if default_suggestions is not None:
+            response["recovery_suggestions"] = list(getattr(e, 'recovery_suggestions', default_suggestions))
+        return response
+    
+    def decorator(tool: _Tool) -> _Tool:
+        if asyncio.iscoroutinefunction(tool):
+            @functools.wraps(tool)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await tool(*args, **kwargs)
+                except Exception as e:
+                    return error_response(e)
+            return cast(_Tool, async_wrapper)
+        
+        @functools.wraps(tool)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return tool(*args, **kwargs)
+            except Exception as e:
+                return error_response(e)
+        return cast(_Tool, wrapper)
+    
+    return decorator
+
 
-def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) -> None:
-    """Register all MCP tools with the server."""
+def register_tools(mcp: FastMCP, document_service: "DocumentGeneratorService",
+                   base_dir: Optional[Path] = None,
+                   admission: Optional[AdmissionController] = None,
+                   template_manager: Optional["TemplateManager"] = None) -> None:
+    """Register all MCP tools with the server.
+    
+    Args:
+        mcp: FastMCP server to register the tools on
+        document_service: Service the generation tools delegate to
+        base_dir: Directory that relative paths resolve against and that file
+            access is restricted to; defaults to the current directory
+        admission: Concurrency cap shared by the async tools; defaults to one
+            sized from the security configuration
+        template_manager: Template manager behind the template tools;
+            defaults to the document service's own
+    """
+    # Fixed once so every request sees the same base, even across chdir
+    base_dir = base_dir or Path.cwd()
+    
+    if admission is None:
+        admission = AdmissionController(_get_security_config().max_concurrent_requests)
+    
+    # One manager, loaded once, shared with the document service so templates
+    # customized here can be used for generation
+    template_manager = template_manager or document_service.template_manager
+    
+    @functools.lru_cache(maxsize=1)
+    def list_templates_response() -> Dict[str, Any]:
+        """Build the list_templates response; cleared when templates change."""
+        templates = template_manager.list_templates()
+        
+        return {
+            "templates": templates,
+            "total_count": len(templates),
+            "template_types": list(set(t['type'] for t in templates))
+        }
+    
+    def admitted(tool: _Tool) -> _Tool:
+        """Run an async tool only once the admission controller lets it in."""
+        @functools.wraps(tool)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            async with admission:
+                return await tool(*args, **kwargs)
+        return cast(_Tool, wrapper)
     
     @mcp.tool()
+    @admitted
+    @_tool_errors(
+        "prd_generation",
+        "PRD generation",
+        default_suggestions=_PRD_RECOVERY,
+        validation_error="Input validation failed",
+        failure_error="Document generation failed"
+    )
     async def generate_prd(
         user_input: str,
         project_context: str = "",
@@ -55,16 +242,16 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
         Returns:
             Dict containing intelligent prompt for Claude to process and generate PRD content
         """
-        try:
+        with SecurityEventBatch("prd_generation") as batch:
             # Security validation
-            security_config = get_secure_defaults()
+            security_config = _get_security_config()
 
             # Validate user input
             validated_user_input = validate_user_input(
                 user_input,
                 max_length=security_config.max_input_length
             )
-            log_input_validation("user_input", True)
+            batch.validated("user_input")
 
             # Validate project context
             validated_project_context = validate_user_input(
@@ -74,16 +261,15 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
 
             # Validate template configuration
             validated_template_config = validate_template_config(template_config)
-            log_input_validation("template_config", True)
+            batch.validated("template_config")
 
             # Validate reference folder
             validated_reference_folder = validate_reference_folder(
                 reference_folder,
-                base_directory=Path.cwd() if security_config.restrict_to_base_directory else None
+                base_directory=base_dir if security_config.restrict_to_base_directory else None
             )
 
-            # Log security event
-            log_security_event("prd_generation_request", {
+            batch.update({
                 "user_input_length": len(validated_user_input),
                 "has_project_context": bool(validated_project_context),
                 "template_config": validated_template_config,
@@ -93,42 +279,24 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
             result = await document_service.generate_prd_prompt(
                 user_input=validated_user_input,
                 project_context=validated_project_context,
-                reference_folder=str(validated_reference_folder) if validated_reference_folder else "",
+                reference_folder=validated_reference_folder,
                 template_config=validated_template_config
             )
 
-            log_security_event("prd_prompt_generation_success", {
+            batch.update({
                 "document_type": result.document_type,
                 "prompt_length": len(result.prompt)
             })
 
-            return result.to_dict()
-
-        except ValidationError as e:
-            log_input_validation("prd_generation", False, e.recovery_suggestions)
-            logger.warning(f"PRD generation validation failed: {e}")
-            return {
-                "error": "Input validation failed",
-                "error_type": "ValidationError",
-                "recovery_suggestions": e.recovery_suggestions
-            }
-        except Exception as e:
-            log_security_event("prd_generation_error", {
-                "error_type": type(e).__name__,
-                "error_message": str(e)[:200]  # Limit error message length
-            }, severity="ERROR")
-            logger.error(f"PRD generation failed: {e}")
-            return {
-                "error": "Document generation failed",
-                "error_type": type(e).__name__,
-                "recovery_suggestions": getattr(e, 'recovery_suggestions', [
-                    "Check input parameters",
-                    "Verify reference folder exists",
-                    "Try with default template"
-                ])
-            }
+        return result.to_dict()
     
     @mcp.tool()
+    @admitted
+    @_tool_errors(
+        "spec_generation",
+        "SPEC prompt generation",
+        default_suggestions=_SPEC_RECOVERY
+    )
     async def generate_spec(
         requirements_input: str,
         existing_prd_path: str = "",
@@ -146,30 +314,22 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
         Returns:
             Dict containing intelligent prompt for Claude to process and generate SPEC content
         """
-        try:
-            result = await document_service.generate_spec_prompt(
-                requirements_input=requirements_input,
-                existing_prd_path=existing_prd_path,
-                reference_folder=reference_folder,
-                template_config=template_config
-            )
-
-            return result.to_dict()
-
-        except Exception as e:
-            logger.error(f"SPEC prompt generation failed: {e}")
-            return {
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "recovery_suggestions": getattr(e, 'recovery_suggestions', [
-                    "Check input parameters",
-                    "Verify existing PRD path if provided",
-                    "Verify reference folder exists",
-                    "Try with default template"
-                ])
-            }
+        result = await document_service.generate_spec_prompt(
+            requirements_input=requirements_input,
+            existing_prd_path=existing_prd_path,
+            reference_folder=reference_folder,
+            template_config=template_config
+        )
+
+        return result.to_dict()
     
     @mcp.tool()
+    @admitted
+    @_tool_errors(
+        "design_generation",
+        "DESIGN prompt generation",
+        default_suggestions=_DESIGN_RECOVERY
+    )
     async def generate_design(
         specification_input: str,
         existing_spec_path: str = "",
@@ -187,30 +347,24 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
         Returns:
             Dict containing intelligent prompt for Claude to process and generate DESIGN content
         """
-        try:
-            result = await document_service.generate_design_prompt(
-                specification_input=specification_input,
-                existing_spec_path=existing_spec_path,
-                reference_folder=reference_folder,
-                template_config=template_config
-            )
-
-            return result.to_dict()
-
-        except Exception as e:
-            logger.error(f"DESIGN prompt generation failed: {e}")
-            return {
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "recovery_suggestions": getattr(e, 'recovery_suggestions', [
-                    "Check input parameters",
-                    "Verify existing SPEC path if provided",
-                    "Verify reference folder exists",
-                    "Try with default template"
-                ])
-            }
+        result = await document_service.generate_design_prompt(
+            specification_input=specification_input,
+            existing_spec_path=existing_spec_path,
+            reference_folder=reference_folder,
+            template_config=template_config
+        )
+
+        return result.to_dict()
     
     @mcp.tool()
+    @admitted
+    @_tool_errors(
+        "resource_analysis",
+        "Resource analysis",
+        default_suggestions=_ANALYSIS_RECOVERY,
+        validation_error="Path validation failed",
+        failure_error="Resource analysis failed"
+    )
     async def analyze_resources(
         folder_path: str = "reference_resources"
     ) -> Dict[str, Any]:
@@ -222,132 +376,104 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
         Returns:
             Dict containing analysis results, file categories, and statistics
         """
-        try:
-            # Security validation
-            security_config = get_secure_defaults()
+        # Security validation
+        security_config = _get_security_config()
+
+        # Validate folder path - resolve relative to current working directory
+        if not Path(folder_path).is_absolute():
+            resolved_folder_path = base_dir / folder_path
+        else:
+            resolved_folder_path = Path(folder_path)
+        
+        validated_folder_path = validate_reference_folder(
+            str(resolved_folder_path),
+            base_directory=base_dir if security_config.restrict_to_base_directory else None
+        )
 
-            # Validate folder path - resolve relative to current working directory
-            if not Path(folder_path).is_absolute():
-                resolved_folder_path = Path.cwd() / folder_path
-            else:
-                resolved_folder_path = Path(folder_path)
-            
-            validated_folder_path = validate_reference_folder(
-                str(resolved_folder_path),
-                base_directory=Path.cwd() if security_config.restrict_to_base_directory else None
-            )
+        if validated_folder_path is None:
+            return {
+                "error": "Invalid or empty folder path",
+                "error_type": "ValidationError",
+                "recovery_suggestions": list(_EMPTY_FOLDER_RECOVERY)
+            }
 
-            if validated_folder_path is None:
-                return {
-                    "error": "Invalid or empty folder path",
-                    "error_type": "ValidationError",
-                    "recovery_suggestions": [
-                        "Provide a valid folder path",
-                        "Ensure folder exists and is accessible"
-                    ]
-                }
-
-            log_input_validation("folder_path", True)
-            log_security_event("resource_analysis_request", {
-                "folder_path": str(validated_folder_path)
-            })
+        with SecurityEventBatch("resource_analysis") as batch:
+            batch.validated("folder_path")
+            batch.add("folder_path", str(validated_folder_path))
 
             # Log the resolved path for debugging
             logger.info(f"Analyzing folder: {validated_folder_path} (resolved from: {folder_path})")
-            logger.info(f"Current working directory: {Path.cwd()}")
+            logger.info(f"Base directory: {base_dir}")
             logger.info(f"Folder exists: {validated_folder_path.exists()}")
             
+            from ..services.resource_analyzer import ResourceAnalyzerService
+            
             resource_analyzer = ResourceAnalyzerService()
             analysis = await resource_analyzer.analyze_folder(validated_folder_path)
 
-            log_security_event("resource_analysis_success", {
+            batch.update({
                 "total_files": analysis.total_files,
                 "categories_count": len(analysis.categorized_files)
             })
 
-            return {
-                "total_files": analysis.total_files,
-                "categories": {
-                    category: len(files)
-                    for category, files in analysis.categorized_files.items()
-                },
-                "content_summary": analysis.content_summary,
-                "processing_errors": analysis.processing_errors,
-                "supported_formats": analysis.supported_formats,
-                "analysis_time": analysis.analysis_time.isoformat()
-            }
-
-        except ValidationError as e:
-            log_input_validation("resource_analysis", False, e.recovery_suggestions)
-            logger.warning(f"Resource analysis validation failed: {e}")
-            return {
-                "error": "Path validation failed",
-                "error_type": "ValidationError",
-                "recovery_suggestions": e.recovery_suggestions
-            }
-        except Exception as e:
-            log_security_event("resource_analysis_error", {
-                "error_type": type(e).__name__,
-                "error_message": str(e)[:200]
-            }, severity="ERROR")
-            logger.error(f"Resource analysis failed: {e}")
-            return {
-                "error": "Resource analysis failed",
-                "error_type": type(e).__name__,
-                "recovery_suggestions": getattr(e, 'recovery_suggestions', [
-                    "Check if folder path exists",
-                    "Verify folder permissions",
-                    "Ensure folder contains supported file types"
-                ])
-            }
+        return {
+            "total_files": analysis.total_files,
+            "categories": {
+                category: len(files)
+                for category, files in analysis.categorized_files.items()
+            },
+            "content_summary": analysis.content_summary,
+            "processing_errors": analysis.processing_errors,
+            "supported_formats": analysis.supported_formats,
+            "analysis_time": analysis.analysis_time.isoformat()
+        }
     
     @mcp.tool()
+    @_tool_errors("list_supported_formats", "Listing supported formats")
     def list_supported_formats() -> Dict[str, Any]:
         """List supported file formats for reference resources
         
         Returns:
             Dict containing supported formats and processor information
         """
-        try:
-            registry = get_registry()
-            return {
-                "supported_extensions": registry.get_supported_extensions(),
-                "processors": registry.get_all_processors_info(),
-                "statistics": registry.get_statistics()
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to list supported formats: {e}")
-            return {
-                "error": str(e),
-                "error_type": type(e).__name__
-            }
+        global _formats_response
+        
+        from ..processors.registry import get_registry
+        
+        registry = get_registry()
+        
+        # Rebuild only when processors were (un)registered since last time
+        if _formats_response is not None:
+            cached_registry, cached_version, response = _formats_response
+            if cached_registry is registry and cached_version == registry.version:
+                return response
+        
+        response = {
+            "supported_extensions": registry.get_supported_extensions(),
+            "processors": registry.get_all_processors_info(),
+            "statistics": registry.get_statistics()
+        }
+        _formats_response = (registry, registry.version, response)
+        return response
     
     @mcp.tool()
+    @_tool_errors("list_templates", "Listing templates")
     def list_templates() -> Dict[str, Any]:
         """List available document templates
         
         Returns:
             Dict containing available templates and their information
         """
-        try:
-            template_manager = TemplateManager()
-            templates = template_manager.list_templates()
-            
-            return {
-                "templates": templates,
-                "total_count": len(templates),
-                "template_types": list(set(t['type'] for t in templates))
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to list templates: {e}")
-            return {
-                "error": str(e),
-                "error_type": type(e).__name__
-            }
+        return list_templates_response()
     
     @mcp.tool()
+    @_tool_errors(
+        "template_customization",
+        "Template customization",
+        default_suggestions=_CUSTOMIZE_RECOVERY,
+        validation_error="Template customization validation failed",
+        failure_error="Template customization failed"
+    )
     def customize_template(
         template_type: str,
         sections: Dict[str, Any],
@@ -363,32 +489,28 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
         Returns:
             Dict containing customized template information
         """
-        try:
-            # Security validation
-            validated_template_type = validate_template_config(template_type)
-
-            # Validate sections dictionary
-            allowed_section_keys = ['add', 'modify', 'remove']
-            validated_sections = validate_dict_input(sections, allowed_keys=allowed_section_keys)
-
-            # Validate formatting rules if provided
-            validated_formatting_rules = None
-            if formatting_rules:
-                allowed_formatting_keys = ['description', 'author', 'supports_customization']
-                validated_formatting_rules = validate_dict_input(
-                    formatting_rules,
-                    allowed_keys=allowed_formatting_keys
-                )
-
-            log_input_validation("template_customization", True)
-            log_security_event("template_customization_request", {
+        # Security validation
+        validated_template_type = validate_template_config(template_type)
+
+        # Validate sections dictionary
+        validated_sections = validate_dict_input(sections, allowed_keys=_SECTION_KEYS)
+
+        # Validate formatting rules if provided
+        validated_formatting_rules = None
+        if formatting_rules:
+            validated_formatting_rules = validate_dict_input(
+                formatting_rules,
+                allowed_keys=_FORMATTING_KEYS
+            )
+
+        with SecurityEventBatch("template_customization") as batch:
+            batch.validated("template_customization")
+            batch.update({
                 "template_type": validated_template_type,
                 "sections_keys": list(validated_sections.keys()),
                 "has_formatting_rules": validated_formatting_rules is not None
             })
 
-            template_manager = TemplateManager()
-
             customizations = {
                 'name': f"custom_{validated_template_type}",
                 'sections': validated_sections
@@ -400,61 +522,39 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
             custom_template = template_manager.customize_template(
                 validated_template_type, customizations
             )
+            
+            # The new template must show up in list_templates
+            list_templates_response.cache_clear()
 
-            log_security_event("template_customization_success", {
+            batch.update({
                 "template_name": custom_template.name,
                 "sections_count": len(custom_template.sections)
             })
 
-            return {
-                "template_name": custom_template.name,
-                "template_type": custom_template.template_type,
-                "sections": list(custom_template.sections.keys()),
-                "validation": template_manager.validate_template(custom_template).to_dict()
-            }
-
-        except ValidationError as e:
-            log_input_validation("template_customization", False, e.recovery_suggestions)
-            logger.warning(f"Template customization validation failed: {e}")
-            return {
-                "error": "Template customization validation failed",
-                "error_type": "ValidationError",
-                "recovery_suggestions": e.recovery_suggestions
-            }
-        except Exception as e:
-            log_security_event("template_customization_error", {
-                "error_type": type(e).__name__,
-                "error_message": str(e)[:200]
-            }, severity="ERROR")
-            logger.error(f"Template customization failed: {e}")
-            return {
-                "error": "Template customization failed",
-                "error_type": type(e).__name__,
-                "recovery_suggestions": getattr(e, 'recovery_suggestions', [
-                    "Check template type is valid (prd, spec, design)",
-                    "Verify section customizations are properly formatted",
-                    "Use list_templates to see available base templates"
-                ])
-            }
+        return {
+            "template_name": custom_template.name,
+            "template_type": custom_template.template_type,
+            "sections": list(custom_template.sections.keys()),
+            "validation": template_manager.validate_template(custom_template).to_dict()
+        }
     
     @mcp.tool()
+    @_tool_errors("generation_statistics", "Getting generation statistics")
     def get_generation_statistics() -> Dict[str, Any]:
         """Get statistics about document generation capabilities
         
         Returns:
             Dict containing system capabilities and statistics
         """
-        try:
-            return document_service.get_generation_statistics()
-            
-        except Exception as e:
-            logger.error(f"Failed to get generation statistics: {e}")
-            return {
-                "error": str(e),
-                "error_type": type(e).__name__
-            }
+        return document_service.get_generation_statistics()
     
     @mcp.tool()
+    @admitted
+    @_tool_errors(
+        "ai_content_save",
+        "Saving AI-generated content",
+        default_suggestions=_SAVE_RECOVERY
+    )
     async def save_generated_document(
         document_type: str,
         content: str,
@@ -474,41 +574,35 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
         Returns:
             Dict containing file_path, validation_result, and metadata
         """
-        try:
-            import asyncio
-
-            # Create AIGeneratedContent object
-            ai_content = AIGeneratedContent(
-                document_type=document_type.lower(),
-                content=content,
-                filename=filename or f"{document_type.upper()}.md",
-                user_notes=user_notes,
-                validation_requested=validate_content
-            )
+        # Canonical, interned form; the service keys its dispatch on it
+        doc_type = sys.intern(document_type.lower())
 
-            result = await document_service.save_ai_generated_content(ai_content)
+        # Create AIGeneratedContent object
+        ai_content = AIGeneratedContent(
+            document_type=doc_type,
+            content=content,
+            filename=filename or f"{doc_type.upper()}.md",
+            user_notes=user_notes,
+            validation_requested=validate_content
+        )
 
-            log_security_event("ai_content_saved", {
-                "document_type": document_type,
-                "filename": ai_content.filename,
-                "content_length": len(content)
-            })
+        result = await document_service.save_ai_generated_content(ai_content)
 
-            return result.to_dict()
+        log_security_event("ai_content_saved", {
+            "document_type": doc_type,
+            "filename": ai_content.filename,
+            "content_length": len(content)
+        })
 
-        except Exception as e:
-            logger.error(f"Failed to save AI-generated content: {e}")
-            return {
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "recovery_suggestions": [
-                    "Check that the content is valid",
-                    "Verify the document type is supported",
-                    "Ensure write permissions to output directory"
-                ]
-            }
+        return result.to_dict()
 
     @mcp.tool()
+    @admitted
+    @_tool_errors(
+        "content_validation",
+        "Content validation",
+        default_suggestions=_VALIDATE_RECOVERY
+    )
     async def validate_generated_content(
         document_type: str,
         content: str
@@ -522,23 +616,11 @@ def register_tools(mcp: FastMCP, document_service: DocumentGeneratorService) ->
         Returns:
             Dict containing validation results and suggestions
         """
-        try:
-            result = await document_service.validate_ai_content(
-                document_type=document_type.lower(),
-                content=content
-            )
+        result = await document_service.validate_ai_content(
+            document_type=sys.intern(document_type.lower()),
+            content=content
+        )
 
-            return result.to_dict()
-
-        except Exception as e:
-            logger.error(f"Content validation failed: {e}")
-            return {
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "recovery_suggestions": [
-                    "Check that the document type is supported",
-                    "Verify the content format is correct"
-                ]
-            }
+        return result.to_dict()
 
     logger.info("Registered all MCP tools successfully")
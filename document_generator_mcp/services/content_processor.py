@@ -5,8 +5,12 @@ This service handles content generation, template rendering, and document format
 following Kiro's document creation patterns and best practices.
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Any, Sequence, Tuple
+import asyncio
+import functools
+import hashlib
 import logging
 import re
 from datetime import datetime
@@ -19,13 +23,248 @@ from ..models.core import (
     PromptResult,
     ContentValidationResult
 )
-from ..models.document_structures import PRDStructure, SPECStructure, DESIGNStructure, DocumentMetadata
+from ..models.document_structures import PRDStructure, SPECStructure, DESIGNStructure
 from ..templates.manager import TemplateManager
 from ..exceptions import ContentGenerationError, ValidationError
 
 
 logger = logging.getLogger(__name__)
 
+# Leading word of an extraction pattern, and what makes its last letter optional
+_LEADING_WORD = re.compile(r'[a-z]+')
+_QUANTIFIERS = frozenset('?*{')
+
+
+def _keyword_patterns(flags: int, *patterns: str) -> Tuple[Tuple[str, "re.Pattern[str]"], ...]:
+    """
+    Compile extraction patterns, each paired with the literal word it starts with.
+    
+    Every pattern can only match where its leading word occurs, so the
+    extractors skip patterns whose word is absent from the input (see
+    _keywords_in) instead of scanning the whole input for each one.
+    
+    Args:
+        flags: re flags for every pattern
+        *patterns: Pattern strings, each starting with a lowercase word
+    
+    Returns:
+        Tuple of (keyword, compiled pattern) pairs
+    """
+    return tuple((_literal_prefix(pattern), re.compile(pattern, flags)) for pattern in patterns)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Return the leading word a pattern cannot match without.
+    
+    The word stops before any quantifier, since the letter it applies to is
+    optional: the prefix of "objectives?" is "objective", not "objectives".
+    """
+    match = _LEADING_WORD.match(pattern)
+    if match is None:
+        raise ValueError(f"Pattern does not start with a lowercase word: {pattern}")
+    
+    word = match.group()
+    if pattern[match.end():match.end() + 1] in _QUANTIFIERS:
+        word = word[:-1]
+    return word
+
+
+# Extraction patterns are compiled once at import; the re module's own cache
+# is shared process-wide and evicts under load.
+_INTRO_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"introduction:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"overview:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"summary:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_OBJECTIVE_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"objectives?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"goals?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"aims?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_TECH_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"technical\s+overview:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"architecture\s+overview:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"system\s+overview:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_ARCH_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"architecture:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"system\s+design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"technical\s+approach:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_COMPONENT_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"component[s]?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"module[s]?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"service[s]?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_DESIGN_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"system\s+design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"implementation:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_UI_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"ui\s+design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"user\s+interface:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"interface\s+design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_FLOW_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"data\s+flow:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"workflow:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"process\s+flow:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_IMPL_PATTERNS = _keyword_patterns(
+    re.IGNORECASE | re.DOTALL,
+    r"implementation\s+approach:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"development\s+approach:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+    r"technical\s+approach:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
+)
+_TITLE_PATTERNS = _keyword_patterns(
+    re.IGNORECASE,
+    r"title:?\s*(.+?)(?:\n|$)",
+    r"project:?\s*(.+?)(?:\n|$)",
+    r"name:?\s*(.+?)(?:\n|$)",
+)
+
+# Splits a block into bullet or numbered list items
+_BULLET_SPLIT = re.compile(r'\n[-*•]\s*|\n\d+\.\s*')
+
+_NON_NAME_CHARS = re.compile(r'[^\w\s-]')
+
+# Formatting clean-up; [^\S\n] is any whitespace str.rstrip() removes except
+# the newline itself
+_TRAILING_WHITESPACE = re.compile(r'[^\S\n]+(?=\n)')
+_EXCESS_BLANK_LINES = re.compile(r'\n{3,}')
+
+# Validation patterns
+_UNREPLACED_PLACEHOLDER = re.compile(r'\{[^}]+\}')
+_MARKDOWN_HEADER = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_USER_STORY_FORMAT = re.compile(r'as\s+(?:a|an)\s+.*?i\s+want.*?so\s+that', re.IGNORECASE)
+_ACCEPTANCE_CRITERIA_MENTION = re.compile(r'acceptance\s+criteria', re.IGNORECASE)
+# Any one of these words marks a SPEC or DESIGN as having substantive content
+_TECHNICAL_KEYWORDS = re.compile(r'API|database|component|interface|architecture', re.IGNORECASE)
+_DESIGN_KEYWORDS = re.compile(r'UI|UX|interface|workflow|user experience', re.IGNORECASE)
+# Placeholder text, reported by pattern source in validation issues
+_PLACEHOLDER_TEXT_PATTERNS = (
+    r"\[.*?\]",  # [placeholder text]
+    r"TODO",
+    r"TBD",
+    r"PLACEHOLDER",
+)
+# All of the above in one scan. The lookahead is zero-width, so a pattern
+# starting inside another's match (TODO in "[TODO]") is still seen; group pN
+# names which pattern matched, and no two can start at the same character.
+_PLACEHOLDER_TEXT_SWEEP = re.compile(
+    '(?=' + '|'.join(
+        f'(?P<p{index}>{pattern})' for index, pattern in enumerate(_PLACEHOLDER_TEXT_PATTERNS)
+    ) + ')',
+    re.IGNORECASE
+)
+
+# Rendered documents kept per processor for regeneration of unchanged input
+_RENDER_CACHE_SIZE = 64
+
+# Case-insensitive search without lowercasing a copy of the whole file
+_PATTERN_MENTION = re.compile(r'pattern', re.IGNORECASE)
+
+_SECTION_PATTERN_GROUPS = (
+    _INTRO_PATTERNS, _OBJECTIVE_PATTERNS, _TECH_PATTERNS, _ARCH_PATTERNS,
+    _COMPONENT_PATTERNS, _DESIGN_PATTERNS, _UI_PATTERNS, _FLOW_PATTERNS,
+    _IMPL_PATTERNS, _TITLE_PATTERNS,
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_keyword_sweep(keywords: FrozenSet[str]) -> "re.Pattern[str]":
+    """Compile one case-insensitive pattern that finds every given keyword."""
+    # Zero-width lookahead so overlapping keywords are all reported; each
+    # keyword is its own named group, reported back through lastgroup
+    alternatives = '|'.join(f'(?P<{kw}>{kw})' for kw in sorted(keywords))
+    return re.compile(f'(?=(?:{alternatives}))', re.IGNORECASE)
+
+
+def _keywords_in(sweep: "re.Pattern[str]", text: str) -> FrozenSet[str]:
+    """Find which extraction keywords occur in a text, in a single pass."""
+    return frozenset(filter(None, (match.lastgroup for match in sweep.finditer(text))))
+
+
+class _InputScan(NamedTuple):
+    """
+    An extraction input with the keywords found in it and its lowered copy.
+    
+    Built once per structure extraction and passed to each extractor, so
+    the input is swept once without keeping it alive past the request.
+    """
+    text: str
+    keywords: FrozenSet[str]
+    lowered: Optional[str]
+
+
+def _ascii_lowered(text: str) -> Optional[str]:
+    """
+    Lowercase an ASCII text for case-sensitive matching, or None otherwise.
+    
+    Only ASCII is folded: there lower() maps each character to exactly one
+    character, so match offsets in the lowered copy are valid in the
+    original, and it agrees with re.IGNORECASE.
+    """
+    return text.lower() if text.isascii() else None
+
+
+@functools.lru_cache(maxsize=64)
+def _case_sensitive(pattern: "re.Pattern[str]") -> "re.Pattern[str]":
+    """Compile the variant of a section pattern that runs on lowered text."""
+    return re.compile(pattern.pattern.replace('[A-Z]', '[a-z]'), pattern.flags & ~re.IGNORECASE)
+
+
+def _bullet_block(label: str, items: Iterable[Any]) -> str:
+    """Format items as a labelled bullet list for a prompt, or "" if there are none."""
+    bullets = ''.join(f"- {item}\n" for item in items)
+    return f"\n**{label}:**\n{bullets}" if bullets else ""
+
+
+def _describe_component(component: Dict[str, Any]) -> str:
+    """Describe a component as 'name: description' for a prompt."""
+    return f"{component.get('name', 'N/A')}: {component.get('description', 'N/A')}"
+
+
+@functools.lru_cache(maxsize=64)
+def _section_headers_re(section_names: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile one pattern for markdown headers naming any of the given sections.
+    
+    Every run of leading hashes matches. The lookahead sets the 'space' group
+    when whitespace follows, which makes the line a markdown header as
+    _MARKDOWN_HEADER defines it; the optional tail matches a header naming
+    a section, each name its own group (s0, s1, ...), so match.lastgroup
+    tells which. Matching is case-insensitive.
+    """
+    alternatives = '|'.join(
+        f'(?P<s{index}>{re.escape(name)})' for index, name in enumerate(section_names)
+    )
+    return re.compile(
+        rf"^#{{1,6}}(?=(?P<space>\s)?)(?:\s*(?:{alternatives})\s*$)?",
+        re.MULTILINE | re.IGNORECASE
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_placeholder_re(keys: FrozenSet[str]) -> "re.Pattern[str]":
+    """
+    Compile a pattern matching any of the given {placeholder} names.
+    
+    Each document type builds the same placeholder keys for every section,
+    so only a few key sets are ever live.
+    """
+    return re.compile(r'\{(' + '|'.join(map(re.escape, keys)) + r')\}')
+
 
 class ContentProcessor:
     """Service for processing and generating document content."""
@@ -46,129 +285,175 @@ class ContentProcessor:
             r"if\s+(.+?)\s+then\s+(.+?)(?:\s+shall\s+(.+))?",
             r"given\s+(.+?)\s+when\s+(.+?)\s+then\s+(.+)"
         ]
+        
+        # Compiled forms used by the extractors. Only patterns with enough
+        # groups for a story (role, feature, benefit) or criterion (condition,
+        # outcome) can ever produce one, so the rest are never run.
+        self._user_story_res = tuple(
+            (keyword, pattern)
+            for keyword, pattern in _keyword_patterns(re.IGNORECASE, *self.user_story_patterns)
+            if pattern.groups >= 3
+        )
+        self._ac_res = tuple(
+            (keyword, pattern)
+            for keyword, pattern in _keyword_patterns(re.IGNORECASE, *self.acceptance_criteria_patterns)
+            if pattern.groups >= 2
+        )
+        
+        # One sweep over the input tells every extractor which of its
+        # patterns can match at all
+        self._keyword_sweep = _compile_keyword_sweep(frozenset(
+            keyword
+            for patterns in (*_SECTION_PATTERN_GROUPS, self._user_story_res, self._ac_res)
+            for keyword, _ in patterns
+        ))
+        
+        # Rendered documents keyed by a digest of their inputs (LRU order)
+        self._render_cache: "OrderedDict[bytes, str]" = OrderedDict()
+    
+    # Structure extractor and placeholder builder for each document type
+    _PIPELINES: Dict[str, Tuple[str, str]] = {
+        "prd": ("_extract_prd_structure", "_create_prd_placeholders"),
+        "spec": ("_extract_spec_structure", "_create_spec_placeholders"),
+        "design": ("_extract_design_structure", "_create_design_placeholders"),
+    }
+    
+    # Sections every document of a type must contain, in report order
+    _REQUIRED_SECTIONS: Dict[str, Tuple[str, ...]] = {
+        "prd": ("Introduction", "Objectives", "Requirements"),
+        "spec": ("Overview", "Architecture", "Components"),
+        "design": ("System Design", "Data Flow", "Implementation"),
+    }
     
     async def process_prd_content(self, context: ProcessingContext) -> str:
         """Process and generate PRD content."""
-        try:
-            logger.info("Starting PRD content processing")
-            
-            # Get PRD template
-            template = self.template_manager.get_template(context.template_config or "prd")
-            
-            # Extract PRD structure from user input and resources
-            prd_structure = self._extract_prd_structure(context)
-            
-            # Generate content for each section
-            section_content = {}
-            for section_name, section_template in template.sections.items():
-                content = await self._generate_prd_section(
-                    section_name, 
-                    section_template, 
-                    prd_structure, 
-                    context
-                )
-                section_content[section_name] = content
-            
-            # Render the complete document
-            document_content = self._render_document(template, section_content, context)
-            
-            # Validate and enhance content
-            enhanced_content = await self._enhance_content(document_content, "prd", context)
-            
-            logger.info("PRD content processing completed")
-            return enhanced_content
-            
-        except Exception as e:
-            logger.error(f"PRD content processing failed: {e}")
-            raise ContentGenerationError("prd", "content_processing", str(e))
+        return await self._process_content("prd", context)
     
     async def process_spec_content(self, context: ProcessingContext) -> str:
         """Process and generate SPEC content."""
-        try:
-            logger.info("Starting SPEC content processing")
-            
-            # Get SPEC template
-            template = self.template_manager.get_template(context.template_config or "spec")
-            
-            # Extract SPEC structure from user input and resources
-            spec_structure = self._extract_spec_structure(context)
-            
-            # Generate content for each section
-            section_content = {}
-            for section_name, section_template in template.sections.items():
-                content = await self._generate_spec_section(
-                    section_name, 
-                    section_template, 
-                    spec_structure, 
-                    context
-                )
-                section_content[section_name] = content
-            
-            # Render the complete document
-            document_content = self._render_document(template, section_content, context)
-            
-            # Validate and enhance content
-            enhanced_content = await self._enhance_content(document_content, "spec", context)
-            
-            logger.info("SPEC content processing completed")
-            return enhanced_content
-            
-        except Exception as e:
-            logger.error(f"SPEC content processing failed: {e}")
-            raise ContentGenerationError("spec", "content_processing", str(e))
+        return await self._process_content("spec", context)
     
     async def process_design_content(self, context: ProcessingContext) -> str:
         """Process and generate DESIGN content."""
+        return await self._process_content("design", context)
+    
+    async def _process_content(self, doc_type: str, context: ProcessingContext) -> str:
+        """
+        Generate a document of the given type from the processing context.
+        
+        Args:
+            doc_type: Document type ('prd', 'spec', 'design')
+            context: Processing context
+            
+        Returns:
+            The rendered and enhanced document content
+            
+        Raises:
+            ContentGenerationError: If any stage of processing fails
+        """
+        label = doc_type.upper()
         try:
-            logger.info("Starting DESIGN content processing")
+            logger.info(f"Starting {label} content processing")
+            extract_name, placeholders_name = self._PIPELINES[doc_type]
             
-            # Get DESIGN template
-            template = self.template_manager.get_template(context.template_config or "design")
+            # Get the document template
+            template = self.template_manager.get_template(context.template_config or doc_type)
             
-            # Extract DESIGN structure from user input and resources
-            design_structure = self._extract_design_structure(context)
+            # Extract the document structure from user input and resources
+            structure = getattr(self, extract_name)(context)
             
-            # Generate content for each section
-            section_content = {}
-            for section_name, section_template in template.sections.items():
-                content = await self._generate_design_section(
-                    section_name, 
-                    section_template, 
-                    design_structure, 
-                    context
-                )
-                section_content[section_name] = content
+            # Placeholder values are the same for every section, and every
+            # date in the document is the day it was started
+            today = datetime.now().strftime('%Y-%m-%d')
+            placeholders = getattr(self, placeholders_name)(structure, context, today)
             
-            # Render the complete document
-            document_content = self._render_document(template, section_content, context)
+            # Generate content for each section; sections are independent,
+            # so they run concurrently and keep the template's order
+            sections = tuple(template.sections.items())
+            results = await asyncio.gather(*(
+                self._generate_section(section_name, section_template, placeholders)
+                for section_name, section_template in sections
+            ))
+            section_content = {
+                section_name: result for (section_name, _), result in zip(sections, results)
+            }
             
-            # Validate and enhance content
-            enhanced_content = await self._enhance_content(document_content, "design", context)
+            # Render, validate and enhance the complete document
+            enhanced_content = await self._render_and_enhance(template, section_content, doc_type, context)
             
-            logger.info("DESIGN content processing completed")
+            logger.info(f"{label} content processing completed")
             return enhanced_content
             
         except Exception as e:
-            logger.error(f"DESIGN content processing failed: {e}")
-            raise ContentGenerationError("design", "content_processing", str(e))
+            logger.error(f"{label} content processing failed: {e}")
+            raise ContentGenerationError(doc_type, "content_processing", str(e))
+    
+    def _scan_input(self, text: str) -> _InputScan:
+        """Sweep a text once for the keywords of every extraction pattern and lower it."""
+        return _InputScan(text, _keywords_in(self._keyword_sweep, text), _ascii_lowered(text))
+    
+    def _present_patterns(self, patterns: Tuple[Tuple[str, "re.Pattern[str]"], ...],
+                          text: str,
+                          scan: Optional[_InputScan] = None) -> List["re.Pattern[str]"]:
+        """Return, in order, the patterns whose leading keyword occurs in the text."""
+        if scan is None:
+            scan = self._scan_input(text)
+        return [pattern for keyword, pattern in patterns if keyword in scan.keywords]
+    
+    def _section_captures(self, patterns: Tuple[Tuple[str, "re.Pattern[str]"], ...],
+                          text: str,
+                          scan: Optional[_InputScan] = None) -> Iterator[str]:
+        """
+        Yield the captured section text of each pattern that matches, in order.
+        
+        ASCII input is matched case-sensitively against a lowered copy, which
+        skips case folding in the regex engine; the capture is sliced from the
+        original text so its case is preserved.
+        
+        Args:
+            patterns: (keyword, pattern) pairs whose group 1 is the section body
+            text: Text to search
+            scan: Keyword scan of the text, if already made
+            
+        Yields:
+            Group 1 of every matching pattern
+        """
+        if scan is None:
+            scan = self._scan_input(text)
+        lowered = scan.lowered
+        for pattern in self._present_patterns(patterns, text, scan):
+            if lowered is None:
+                match = pattern.search(text)
+                if match:
+                    yield match.group(1)
+            else:
+                match = _case_sensitive(pattern).search(lowered)
+                if match:
+                    yield text[match.start(1):match.end(1)]
     
     def _extract_prd_structure(self, context: ProcessingContext) -> PRDStructure:
         """Extract PRD structure from context."""
+        # The context is fixed for one request, so prompt and content
+        # generation share a single extraction
+        cached = context.extracted_structures.get("prd")
+        if isinstance(cached, PRDStructure):
+            return cached
+        
+        user_input = context.user_input
+        scan = self._scan_input(user_input)
         prd = PRDStructure()
         
         # Extract introduction from user input
-        prd.introduction = self._extract_introduction(context.user_input)
+        prd.introduction = self._extract_introduction(user_input, scan)
         
         # Extract objectives
-        prd.objectives = self._extract_objectives(context.user_input)
+        prd.objectives = self._extract_objectives(user_input, scan)
         
         # Extract user stories
-        user_stories = self._extract_user_stories(context.user_input)
-        for story in user_stories:
-            prd.user_stories.append(story)
+        prd.user_stories.extend(self._extract_user_stories(user_input, scan))
         
         # Extract acceptance criteria
-        criteria = self._extract_acceptance_criteria(context.user_input)
+        criteria = self._extract_acceptance_criteria(user_input, scan)
         for criterion in criteria:
             prd.add_acceptance_criteria(criterion)
         
@@ -176,90 +461,81 @@ class ContentProcessor:
         if context.reference_resources:
             self._enhance_prd_from_resources(prd, context.reference_resources)
         
+        context.extracted_structures["prd"] = prd
         return prd
     
     def _extract_spec_structure(self, context: ProcessingContext) -> SPECStructure:
         """Extract SPEC structure from context."""
+        cached = context.extracted_structures.get("spec")
+        if isinstance(cached, SPECStructure):
+            return cached
+        
+        user_input = context.user_input
+        scan = self._scan_input(user_input)
         spec = SPECStructure()
         
         # Extract technical overview
-        spec.overview = self._extract_technical_overview(context.user_input)
+        spec.overview = self._extract_technical_overview(user_input, scan)
         
         # Extract architecture information
-        spec.architecture = self._extract_architecture_info(context.user_input)
+        spec.architecture = self._extract_architecture_info(user_input, scan)
         
         # Extract components
-        components = self._extract_components(context.user_input)
-        for component in components:
-            spec.components.append(component)
+        spec.components.extend(self._extract_components(user_input, scan))
         
         # Extract from reference resources if available
         if context.reference_resources:
             self._enhance_spec_from_resources(spec, context.reference_resources)
         
+        context.extracted_structures["spec"] = spec
         return spec
     
     def _extract_design_structure(self, context: ProcessingContext) -> DESIGNStructure:
         """Extract DESIGN structure from context."""
+        cached = context.extracted_structures.get("design")
+        if isinstance(cached, DESIGNStructure):
+            return cached
+        
+        user_input = context.user_input
+        scan = self._scan_input(user_input)
         design = DESIGNStructure()
         
         # Extract system design information
-        design.system_design = self._extract_system_design(context.user_input)
+        design.system_design = self._extract_system_design(user_input, scan)
         
         # Extract UI design information
-        design.user_interface_design = self._extract_ui_design(context.user_input)
+        design.user_interface_design = self._extract_ui_design(user_input, scan)
         
         # Extract data flow information
-        design.data_flow = self._extract_data_flow(context.user_input)
+        design.data_flow = self._extract_data_flow(user_input, scan)
         
         # Extract implementation approach
-        design.implementation_approach = self._extract_implementation_approach(context.user_input)
+        design.implementation_approach = self._extract_implementation_approach(user_input, scan)
         
         # Extract from reference resources if available
         if context.reference_resources:
             self._enhance_design_from_resources(design, context.reference_resources)
         
+        context.extracted_structures["design"] = design
         return design
     
-    def _extract_introduction(self, user_input: str) -> str:
+    def _extract_introduction(self, user_input: str, scan: Optional[_InputScan] = None) -> str:
         """Extract introduction content from user input."""
-        # Look for introduction patterns
-        intro_patterns = [
-            r"introduction:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"overview:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"summary:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-        
-        for pattern in intro_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
-        
-        # If no specific introduction found, use first paragraph
-        paragraphs = user_input.split('\n\n')
-        if paragraphs:
-            return paragraphs[0].strip()
+        for captured in self._section_captures(_INTRO_PATTERNS, user_input, scan):
+            return captured.strip()
         
-        return user_input[:200] + "..." if len(user_input) > 200 else user_input
+        # If no specific introduction found, use first paragraph; partition
+        # stops at the first break instead of splitting the whole input
+        return user_input.partition('\n\n')[0].strip()
     
-    def _extract_objectives(self, user_input: str) -> List[str]:
+    def _extract_objectives(self, user_input: str, scan: Optional[_InputScan] = None) -> List[str]:
         """Extract objectives from user input."""
-        objectives = []
+        objectives: List[str] = []
         
-        # Look for objective patterns
-        objective_patterns = [
-            r"objectives?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"goals?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"aims?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-        
-        for pattern in objective_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                objective_text = match.group(1).strip()
-                # Split by bullet points or numbered lists
-                objective_lines = re.split(r'\n[-*•]\s*|\n\d+\.\s*', objective_text)
-                objectives.extend([obj.strip() for obj in objective_lines if obj.strip()])
+        for objective_text in self._section_captures(_OBJECTIVE_PATTERNS, user_input, scan):
+            # Split by bullet points or numbered lists
+            objective_lines = _BULLET_SPLIT.split(objective_text.strip())
+            objectives.extend(filter(None, map(str.strip, objective_lines)))
         
         # If no specific objectives found, infer from user input
         if not objectives:
@@ -267,157 +543,100 @@ class ContentProcessor:
         
         return objectives
     
-    def _extract_user_stories(self, user_input: str) -> List[Dict[str, Any]]:
+    def _extract_user_stories(self, user_input: str, scan: Optional[_InputScan] = None) -> List[Dict[str, Any]]:
         """Extract user stories from user input."""
         stories = []
         
-        for pattern in self.user_story_patterns:
-            matches = re.finditer(pattern, user_input, re.IGNORECASE)
-            for match in matches:
-                if len(match.groups()) >= 3:
-                    story = {
-                        "role": match.group(1).strip(),
-                        "feature": match.group(2).strip(),
-                        "benefit": match.group(3).strip(),
-                        "story": f"As a {match.group(1).strip()}, I want {match.group(2).strip()}, so that {match.group(3).strip()}",
-                        "criteria": []
-                    }
-                    stories.append(story)
+        for pattern in self._present_patterns(self._user_story_res, user_input, scan):
+            for match in pattern.finditer(user_input):
+                role, feature, benefit = (group.strip() for group in match.group(1, 2, 3))
+                story = {
+                    "role": role,
+                    "feature": feature,
+                    "benefit": benefit,
+                    "story": f"As a {role}, I want {feature}, so that {benefit}",
+                    "criteria": []
+                }
+                stories.append(story)
         
         return stories
     
-    def _extract_acceptance_criteria(self, user_input: str) -> List[str]:
+    def _extract_acceptance_criteria(self, user_input: str, scan: Optional[_InputScan] = None) -> List[str]:
         """Extract acceptance criteria from user input."""
         criteria = []
         
-        for pattern in self.acceptance_criteria_patterns:
-            matches = re.finditer(pattern, user_input, re.IGNORECASE)
-            for match in matches:
-                if len(match.groups()) >= 2:
-                    criterion = f"WHEN {match.group(1).strip()} THEN the system SHALL {match.group(2).strip()}"
-                    if len(match.groups()) >= 3 and match.group(3):
-                        criterion += f" {match.group(3).strip()}"
-                    criteria.append(criterion)
+        for pattern in self._present_patterns(self._ac_res, user_input, scan):
+            has_third_group = pattern.groups >= 3
+            for match in pattern.finditer(user_input):
+                condition, outcome = match.group(1, 2)
+                detail = match.group(3) if has_third_group else None
+                if detail:
+                    criteria.append(f"WHEN {condition.strip()} THEN the system SHALL {outcome.strip()} {detail.strip()}")
+                else:
+                    criteria.append(f"WHEN {condition.strip()} THEN the system SHALL {outcome.strip()}")
         
         return criteria
 
-    def _extract_technical_overview(self, user_input: str) -> str:
+    def _extract_technical_overview(self, user_input: str, scan: Optional[_InputScan] = None) -> str:
         """Extract technical overview from user input."""
-        # Look for technical overview patterns
-        tech_patterns = [
-            r"technical\s+overview:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"architecture\s+overview:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"system\s+overview:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-
-        for pattern in tech_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        for captured in self._section_captures(_TECH_PATTERNS, user_input, scan):
+            return captured.strip()
 
         # Default technical overview
         return f"This document provides the technical specification for implementing the requirements outlined in the user input."
 
-    def _extract_architecture_info(self, user_input: str) -> str:
+    def _extract_architecture_info(self, user_input: str, scan: Optional[_InputScan] = None) -> str:
         """Extract architecture information from user input."""
-        arch_patterns = [
-            r"architecture:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"system\s+design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"technical\s+approach:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-
-        for pattern in arch_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        for captured in self._section_captures(_ARCH_PATTERNS, user_input, scan):
+            return captured.strip()
 
         return "The system follows a modular architecture with clear separation of concerns."
 
-    def _extract_components(self, user_input: str) -> List[Dict[str, Any]]:
+    def _extract_components(self, user_input: str, scan: Optional[_InputScan] = None) -> List[Dict[str, Any]]:
         """Extract system components from user input."""
         components = []
 
-        # Look for component mentions
-        component_patterns = [
-            r"component[s]?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"module[s]?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"service[s]?:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-
-        for pattern in component_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                component_text = match.group(1).strip()
-                # Split by bullet points or numbered lists
-                component_lines = re.split(r'\n[-*•]\s*|\n\d+\.\s*', component_text)
-                for line in component_lines:
-                    if line.strip():
-                        components.append({
-                            "name": line.strip().split(':')[0] if ':' in line else line.strip(),
-                            "description": line.strip().split(':', 1)[1].strip() if ':' in line else "Component description",
-                            "responsibilities": [],
-                            "dependencies": []
-                        })
+        for component_text in self._section_captures(_COMPONENT_PATTERNS, user_input, scan):
+            # Split by bullet points or numbered lists
+            component_lines = _BULLET_SPLIT.split(component_text.strip())
+            for line in component_lines:
+                line = line.strip()
+                if line:
+                    name, separator, description = line.partition(':')
+                    components.append({
+                        "name": name,
+                        "description": description.strip() if separator else "Component description",
+                        "responsibilities": [],
+                        "dependencies": []
+                    })
 
         return components
 
-    def _extract_system_design(self, user_input: str) -> str:
+    def _extract_system_design(self, user_input: str, scan: Optional[_InputScan] = None) -> str:
         """Extract system design information from user input."""
-        design_patterns = [
-            r"system\s+design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"implementation:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-
-        for pattern in design_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        for captured in self._section_captures(_DESIGN_PATTERNS, user_input, scan):
+            return captured.strip()
 
         return "The system design follows established patterns and best practices."
 
-    def _extract_ui_design(self, user_input: str) -> str:
+    def _extract_ui_design(self, user_input: str, scan: Optional[_InputScan] = None) -> str:
         """Extract UI design information from user input."""
-        ui_patterns = [
-            r"ui\s+design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"user\s+interface:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"interface\s+design:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-
-        for pattern in ui_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        for captured in self._section_captures(_UI_PATTERNS, user_input, scan):
+            return captured.strip()
 
         return "The user interface design prioritizes usability and accessibility."
 
-    def _extract_data_flow(self, user_input: str) -> str:
+    def _extract_data_flow(self, user_input: str, scan: Optional[_InputScan] = None) -> str:
         """Extract data flow information from user input."""
-        flow_patterns = [
-            r"data\s+flow:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"workflow:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"process\s+flow:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-
-        for pattern in flow_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        for captured in self._section_captures(_FLOW_PATTERNS, user_input, scan):
+            return captured.strip()
 
         return "Data flows through the system in a structured and efficient manner."
 
-    def _extract_implementation_approach(self, user_input: str) -> str:
+    def _extract_implementation_approach(self, user_input: str, scan: Optional[_InputScan] = None) -> str:
         """Extract implementation approach from user input."""
-        impl_patterns = [
-            r"implementation\s+approach:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"development\s+approach:?\s*(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"technical\s+approach:?\s*(.+?)(?:\n\n|\n[A-Z]|$)"
-        ]
-
-        for pattern in impl_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        for captured in self._section_captures(_IMPL_PATTERNS, user_input, scan):
+            return captured.strip()
 
         return "The implementation follows an iterative development approach with continuous testing and validation."
 
@@ -427,11 +646,12 @@ class ContentProcessor:
         requirements_files = resources.get_files_by_category('requirements')
         for file_content in requirements_files:
             # Extract additional user stories
-            stories = self._extract_user_stories(file_content.extracted_text)
+            scan = self._scan_input(file_content.extracted_text)
+            stories = self._extract_user_stories(file_content.extracted_text, scan)
             prd.user_stories.extend(stories)
 
             # Extract additional acceptance criteria
-            criteria = self._extract_acceptance_criteria(file_content.extracted_text)
+            criteria = self._extract_acceptance_criteria(file_content.extracted_text, scan)
             for criterion in criteria:
                 prd.add_acceptance_criteria(criterion)
 
@@ -450,49 +670,30 @@ class ContentProcessor:
         design_files = resources.get_files_by_category('design')
         for file_content in design_files:
             # Extract design patterns and constraints
-            if 'pattern' in file_content.extracted_text.lower():
+            if _PATTERN_MENTION.search(file_content.extracted_text):
                 design.design_patterns.append({
                     "name": "Referenced Pattern",
                     "description": "Pattern found in reference materials",
                     "use_case": "As specified in reference documentation"
                 })
 
-    async def _generate_prd_section(self, section_name: str, section_template: str,
-                                   prd_structure: PRDStructure, context: ProcessingContext) -> str:
-        """Generate content for a PRD section."""
-        # Create placeholder values based on section and structure
-        placeholders = self._create_prd_placeholders(section_name, prd_structure, context)
-
-        # Replace placeholders in template
-        return self._replace_placeholders(section_template, placeholders)
-
-    async def _generate_spec_section(self, section_name: str, section_template: str,
-                                    spec_structure: SPECStructure, context: ProcessingContext) -> str:
-        """Generate content for a SPEC section."""
-        # Create placeholder values based on section and structure
-        placeholders = self._create_spec_placeholders(section_name, spec_structure, context)
-
+    async def _generate_section(self, section_name: str, section_template: str,
+                                placeholders: Dict[str, str]) -> str:
+        """Generate content for a document section."""
         # Replace placeholders in template
         return self._replace_placeholders(section_template, placeholders)
 
-    async def _generate_design_section(self, section_name: str, section_template: str,
-                                      design_structure: DESIGNStructure, context: ProcessingContext) -> str:
-        """Generate content for a DESIGN section."""
-        # Create placeholder values based on section and structure
-        placeholders = self._create_design_placeholders(section_name, design_structure, context)
-
-        # Replace placeholders in template
-        return self._replace_placeholders(section_template, placeholders)
-
-    def _create_prd_placeholders(self, section_name: str, prd_structure: PRDStructure,
-                                context: ProcessingContext) -> Dict[str, str]:
-        """Create placeholder values for PRD sections."""
-        now = datetime.now()
+    def _create_prd_placeholders(self, prd_structure: PRDStructure,
+                                context: ProcessingContext,
+                                today: Optional[str] = None) -> Dict[str, str]:
+        """Create placeholder values shared by all PRD sections."""
+        today = today or datetime.now().strftime('%Y-%m-%d')
+        title = self._extract_title(context.user_input)
         placeholders = {
-            'title': self._extract_title(context.user_input),
-            'project_name': self._extract_project_name(context.user_input),
-            'created_date': now.strftime('%Y-%m-%d'),
-            'last_modified': now.strftime('%Y-%m-%d'),
+            'title': title,
+            'project_name': self._extract_project_name(title),
+            'created_date': today,
+            'last_modified': today,
             'introduction_content': prd_structure.introduction,
             'project_context': context.project_context or "Project context to be defined",
             'objectives_list': self._format_list(prd_structure.objectives),
@@ -513,15 +714,17 @@ class ContentProcessor:
 
         return placeholders
 
-    def _create_spec_placeholders(self, section_name: str, spec_structure: SPECStructure,
-                                 context: ProcessingContext) -> Dict[str, str]:
-        """Create placeholder values for SPEC sections."""
-        now = datetime.now()
+    def _create_spec_placeholders(self, spec_structure: SPECStructure,
+                                 context: ProcessingContext,
+                                 today: Optional[str] = None) -> Dict[str, str]:
+        """Create placeholder values shared by all SPEC sections."""
+        today = today or datetime.now().strftime('%Y-%m-%d')
+        title = self._extract_title(context.user_input)
         placeholders = {
-            'title': self._extract_title(context.user_input),
-            'project_name': self._extract_project_name(context.user_input),
-            'created_date': now.strftime('%Y-%m-%d'),
-            'last_modified': now.strftime('%Y-%m-%d'),
+            'title': title,
+            'project_name': self._extract_project_name(title),
+            'created_date': today,
+            'last_modified': today,
             'prd_document': "PRD.md",
             'overview_content': spec_structure.overview,
             'scope_description': "Scope description based on requirements",
@@ -550,15 +753,17 @@ class ContentProcessor:
 
         return placeholders
 
-    def _create_design_placeholders(self, section_name: str, design_structure: DESIGNStructure,
-                                   context: ProcessingContext) -> Dict[str, str]:
-        """Create placeholder values for DESIGN sections."""
-        now = datetime.now()
+    def _create_design_placeholders(self, design_structure: DESIGNStructure,
+                                   context: ProcessingContext,
+                                   today: Optional[str] = None) -> Dict[str, str]:
+        """Create placeholder values shared by all DESIGN sections."""
+        today = today or datetime.now().strftime('%Y-%m-%d')
+        title = self._extract_title(context.user_input)
         placeholders = {
-            'title': self._extract_title(context.user_input),
-            'project_name': self._extract_project_name(context.user_input),
-            'created_date': now.strftime('%Y-%m-%d'),
-            'last_modified': now.strftime('%Y-%m-%d'),
+            'title': title,
+            'project_name': self._extract_project_name(title),
+            'created_date': today,
+            'last_modified': today,
             'prd_document': "PRD.md",
             'spec_document': "SPEC.md",
             'system_design_description': design_structure.system_design,
@@ -595,32 +800,23 @@ class ContentProcessor:
 
     def _extract_title(self, user_input: str) -> str:
         """Extract project title from user input."""
-        # Look for title patterns
-        title_patterns = [
-            r"title:?\s*(.+?)(?:\n|$)",
-            r"project:?\s*(.+?)(?:\n|$)",
-            r"name:?\s*(.+?)(?:\n|$)"
-        ]
-
-        for pattern in title_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        for captured in self._section_captures(_TITLE_PATTERNS, user_input):
+            return captured.strip()
 
-        # Default title based on first line or words
-        first_line = user_input.split('\n')[0].strip()
+        # Default title based on first line or words; bounded splits so a
+        # large input isn't broken into every line or word just to read the start
+        first_line = user_input.partition('\n')[0].strip()
         if len(first_line) < 100:
             return first_line
 
         # Use first few words
-        words = user_input.split()[:5]
+        words = user_input.split(maxsplit=5)[:5]
         return ' '.join(words) + "..."
 
-    def _extract_project_name(self, user_input: str) -> str:
-        """Extract project name from user input."""
-        title = self._extract_title(user_input)
+    def _extract_project_name(self, title: str) -> str:
+        """Derive the project name from an extracted title."""
         # Clean up title to make it a proper project name
-        project_name = re.sub(r'[^\w\s-]', '', title)
+        project_name = _NON_NAME_CHARS.sub('', title)
         return project_name.strip() or "Project"
 
     def _format_list(self, items: List[str]) -> str:
@@ -628,87 +824,78 @@ class ContentProcessor:
         if not items:
             return "- Items to be defined"
 
-        return '\n'.join([f"- {item}" for item in items])
+        # One join, with no per-item string built for the bullet prefix
+        return "- " + "\n- ".join(map(str, items))
 
     def _format_user_stories(self, stories: List[Dict[str, Any]]) -> str:
         """Format user stories as markdown."""
         if not stories:
             return "### User stories to be defined based on requirements"
 
-        formatted = []
+        # One string per story, separated by an empty line
+        blocks = []
         for i, story in enumerate(stories, 1):
-            formatted.append(f"### Requirement {i}")
-            formatted.append(f"**User Story:** {story['story']}")
+            block = f"### Requirement {i}\n**User Story:** {story['story']}\n"
             if story.get('criteria'):
-                formatted.append("#### Acceptance Criteria")
-                for j, criteria in enumerate(story['criteria'], 1):
-                    formatted.append(f"{j}. {criteria}")
-            formatted.append("")  # Empty line
+                block += "#### Acceptance Criteria\n" + '\n'.join(
+                    f"{j}. {criteria}" for j, criteria in enumerate(story['criteria'], 1)
+                ) + "\n"
+            blocks.append(block)
 
-        return '\n'.join(formatted)
+        return '\n'.join(blocks)
 
     def _format_components(self, components: List[Dict[str, Any]]) -> str:
         """Format components as markdown."""
         if not components:
             return "Components to be defined based on architecture"
 
-        formatted = []
+        # One string per component, separated by an empty line
+        blocks = []
         for component in components:
-            formatted.append(f"### {component['name']}")
-            formatted.append(f"{component['description']}")
+            block = f"### {component['name']}\n{component['description']}\n"
             if component.get('responsibilities'):
-                formatted.append("**Responsibilities:**")
-                for resp in component['responsibilities']:
-                    formatted.append(f"- {resp}")
-            formatted.append("")
+                block += "**Responsibilities:**\n" + ''.join(
+                    f"- {resp}\n" for resp in component['responsibilities']
+                )
+            blocks.append(block)
 
-        return '\n'.join(formatted)
+        return '\n'.join(blocks)
 
     def _format_interfaces(self, interfaces: List[Dict[str, Any]]) -> str:
         """Format interfaces as markdown."""
         if not interfaces:
             return "Interfaces to be defined based on system requirements"
 
-        formatted = []
-        for interface in interfaces:
-            formatted.append(f"### {interface['name']}")
-            formatted.append(f"**Type:** {interface['type']}")
-            formatted.append(f"{interface['description']}")
-            formatted.append("")
-
-        return '\n'.join(formatted)
+        return '\n'.join(
+            f"### {interface['name']}\n**Type:** {interface['type']}\n{interface['description']}\n"
+            for interface in interfaces
+        )
 
     def _format_data_models(self, models: List[Dict[str, Any]]) -> str:
         """Format data models as markdown."""
         if not models:
             return "Data models to be defined based on system requirements"
 
-        formatted = []
+        # One string per model, separated by an empty line
+        blocks = []
         for model in models:
-            formatted.append(f"### {model['name']}")
-            formatted.append(f"{model['description']}")
+            block = f"### {model['name']}\n{model['description']}\n"
             if model.get('fields'):
-                formatted.append("**Fields:**")
-                for field in model['fields']:
-                    formatted.append(f"- {field}")
-            formatted.append("")
+                block += "**Fields:**\n" + ''.join(f"- {field}\n" for field in model['fields'])
+            blocks.append(block)
 
-        return '\n'.join(formatted)
+        return '\n'.join(blocks)
 
     def _format_design_patterns(self, patterns: List[Dict[str, Any]]) -> str:
         """Format design patterns as markdown."""
         if not patterns:
             return "Design patterns to be identified based on system requirements"
 
-        formatted = []
-        for pattern in patterns:
-            formatted.append(f"### {pattern['name']}")
-            formatted.append(f"{pattern['description']}")
-            if pattern.get('use_case'):
-                formatted.append(f"**Use Case:** {pattern['use_case']}")
-            formatted.append("")
-
-        return '\n'.join(formatted)
+        return '\n'.join(
+            f"### {pattern['name']}\n{pattern['description']}\n"
+            + (f"**Use Case:** {pattern['use_case']}\n" if pattern.get('use_case') else "")
+            for pattern in patterns
+        )
 
     def _generate_architecture_diagram(self, context: ProcessingContext) -> str:
         """Generate a basic architecture diagram in Mermaid format."""
@@ -760,42 +947,63 @@ class ContentProcessor:
 
     def _replace_placeholders(self, template: str, placeholders: Dict[str, str]) -> str:
         """Replace placeholders in template with actual values."""
-        result = template
-
-        for placeholder, value in placeholders.items():
-            pattern = f"{{{placeholder}}}"
-            result = result.replace(pattern, str(value))
+        if not placeholders or '{' not in template:
+            return template
 
-        return result
+        # One pass over the template; substituted values are not rescanned
+        pattern = _compile_placeholder_re(frozenset(placeholders))
+        return pattern.sub(lambda match: str(placeholders[match.group(1)]), template)
 
+    async def _render_and_enhance(self, template: Template, section_content: Dict[str, str],
+                                  doc_type: str, context: ProcessingContext) -> str:
+        """
+        Render and enhance a document, reusing the result for repeated inputs.
+        
+        Both steps depend only on the template, the section content and the
+        document type, so regenerating an unchanged document is a cache hit.
+        
+        Args:
+            template: Template whose section order is rendered
+            section_content: Generated content per section
+            doc_type: Document type ('prd', 'spec', 'design')
+            context: Processing context
+            
+        Returns:
+            The enhanced document content
+        """
+        key_source = repr((template.name, doc_type, tuple(section_content.items())))
+        key = hashlib.blake2b(key_source.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            self._render_cache.move_to_end(key)
+            return cached
+        
+        document_content = self._render_document(template, section_content, context)
+        enhanced_content = await self._enhance_content(document_content, doc_type, context)
+        
+        self._render_cache[key] = enhanced_content
+        if len(self._render_cache) > _RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+        
+        return enhanced_content
+    
     def _render_document(self, template: Template, section_content: Dict[str, str],
                         context: ProcessingContext) -> str:
         """Render the complete document from template and section content."""
-        # Combine all sections in the order defined by the template
-        document_parts = []
-
-        for section_name in template.sections.keys():
-            if section_name in section_content:
-                content = section_content[section_name]
-                if content.strip():  # Only add non-empty sections
-                    document_parts.append(content)
-
-        return '\n\n'.join(document_parts)
+        # Combine all non-empty sections in the order defined by the template;
+        # join gets a list so it can size the result up front
+        return '\n\n'.join([
+            content
+            for content in map(section_content.get, template.sections)
+            if content and content.strip()
+        ])
 
     async def _enhance_content(self, content: str, doc_type: str,
                               context: ProcessingContext) -> str:
         """Enhance generated content with additional formatting and validation."""
-        enhanced = content
-
-        # Add document metadata
-        metadata = DocumentMetadata(
-            document_type=doc_type,
-            created_date=datetime.now().strftime('%Y-%m-%d'),
-            last_modified=datetime.now().strftime('%Y-%m-%d')
-        )
-
         # Clean up formatting
-        enhanced = self._clean_formatting(enhanced)
+        enhanced = self._clean_formatting(content)
 
         # Add cross-references if applicable
         enhanced = self._add_cross_references(enhanced, doc_type, context)
@@ -809,18 +1017,10 @@ class ContentProcessor:
 
     def _clean_formatting(self, content: str) -> str:
         """Clean up document formatting."""
-        # Remove excessive whitespace
-        lines = content.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            cleaned_lines.append(line.rstrip())
-
-        # Remove excessive empty lines
-        result = '\n'.join(cleaned_lines)
-        result = re.sub(r'\n{3,}', '\n\n', result)
-
-        return result.strip()
+        # Remove trailing whitespace from every line, then excessive empty
+        # lines; the final strip covers the last line
+        result = _TRAILING_WHITESPACE.sub('', content)
+        return _EXCESS_BLANK_LINES.sub('\n\n', result).strip()
 
     def _add_cross_references(self, content: str, doc_type: str,
                              context: ProcessingContext) -> str:
@@ -841,8 +1041,7 @@ class ContentProcessor:
             )
 
         # Check for placeholder content that wasn't replaced
-        placeholder_pattern = r'\{[^}]+\}'
-        placeholders = re.findall(placeholder_pattern, content)
+        placeholders = _UNREPLACED_PLACEHOLDER.findall(content)
         if placeholders:
             validation_result.add_issue(
                 f"Unreplaced placeholders found: {', '.join(placeholders)}",
@@ -851,8 +1050,9 @@ class ContentProcessor:
 
         # Check for required sections based on document type
         required_sections = self._get_required_sections_for_validation(doc_type)
+        lowered = content.lower()
         for section in required_sections:
-            if section.lower() not in content.lower():
+            if section.lower() not in lowered:
                 validation_result.add_issue(
                     f"Missing required section: {section}",
                     f"Add the '{section}' section to the document"
@@ -860,14 +1060,48 @@ class ContentProcessor:
 
         return validation_result
 
-    def _get_required_sections_for_validation(self, doc_type: str) -> List[str]:
+    def _get_required_sections_for_validation(self, doc_type: str) -> Tuple[str, ...]:
         """Get required sections for content validation."""
-        required_sections = {
-            'prd': ['Introduction', 'Objectives', 'Requirements'],
-            'spec': ['Overview', 'Architecture', 'Components'],
-            'design': ['System Design', 'Data Flow', 'Implementation']
-        }
-        return required_sections.get(doc_type, [])
+        return self._REQUIRED_SECTIONS.get(doc_type, ())
+
+    async def generate_all_prompts(self, context: ProcessingContext) -> List[PromptResult]:
+        """
+        Generate PRD, SPEC and DESIGN prompts for the same context concurrently.
+        
+        Args:
+            context: Processing context shared by all three prompts
+            
+        Returns:
+            The PRD, SPEC and DESIGN prompt results, in that order
+        """
+        return list(await asyncio.gather(
+            self.generate_prd_prompt(context),
+            self.generate_spec_prompt(context),
+            self.generate_design_prompt(context),
+        ))
+
+    def _prepare_prompt(self, context: ProcessingContext, template: Template,
+                        extract: Callable[[ProcessingContext], Any],
+                        create_prompt: Callable[[ProcessingContext, Any, Template], str],
+                        label: str) -> Tuple[Any, str, str]:
+        """
+        Extract a document structure and build its prompt and context summary.
+        
+        Synchronous so the prompt generators can run it in a worker thread.
+        
+        Args:
+            context: Processing context
+            template: Template for the document type
+            extract: Structure extractor for the document type
+            create_prompt: Prompt builder for the document type
+            label: Document type label for the context summary
+            
+        Returns:
+            Tuple of (structure, prompt, context summary)
+        """
+        structure = extract(context)
+        prompt = create_prompt(context, structure, template)
+        return structure, prompt, self._create_context_summary(context, label)
 
     async def generate_prd_prompt(self, context: ProcessingContext) -> PromptResult:
         """Generate intelligent prompt for PRD creation."""
@@ -877,14 +1111,11 @@ class ContentProcessor:
             # Get PRD template structure
             template = self.template_manager.get_template(context.template_config or "prd")
 
-            # Extract PRD structure from context
-            prd_structure = self._extract_prd_structure(context)
-
-            # Create intelligent prompt
-            prompt = self._create_prd_prompt(context, prd_structure, template)
-
-            # Create context summary
-            context_summary = self._create_context_summary(context, "PRD")
+            # Extract structure, create prompt and summary off the event loop
+            prd_structure, prompt, context_summary = await asyncio.to_thread(
+                self._prepare_prompt, context, template,
+                self._extract_prd_structure, self._create_prd_prompt, "PRD"
+            )
 
             return PromptResult(
                 document_type="prd",
@@ -914,14 +1145,11 @@ class ContentProcessor:
             # Get SPEC template structure
             template = self.template_manager.get_template(context.template_config or "spec")
 
-            # Extract SPEC structure from context
-            spec_structure = self._extract_spec_structure(context)
-
-            # Create intelligent prompt
-            prompt = self._create_spec_prompt(context, spec_structure, template)
-
-            # Create context summary
-            context_summary = self._create_context_summary(context, "SPEC")
+            # Extract structure, create prompt and summary off the event loop
+            spec_structure, prompt, context_summary = await asyncio.to_thread(
+                self._prepare_prompt, context, template,
+                self._extract_spec_structure, self._create_spec_prompt, "SPEC"
+            )
 
             return PromptResult(
                 document_type="spec",
@@ -951,14 +1179,11 @@ class ContentProcessor:
             # Get DESIGN template structure
             template = self.template_manager.get_template(context.template_config or "design")
 
-            # Extract DESIGN structure from context
-            design_structure = self._extract_design_structure(context)
-
-            # Create intelligent prompt
-            prompt = self._create_design_prompt(context, design_structure, template)
-
-            # Create context summary
-            context_summary = self._create_context_summary(context, "DESIGN")
+            # Extract structure, create prompt and summary off the event loop
+            design_structure, prompt, context_summary = await asyncio.to_thread(
+                self._prepare_prompt, context, template,
+                self._extract_design_structure, self._create_design_prompt, "DESIGN"
+            )
 
             return PromptResult(
                 document_type="design",
@@ -995,8 +1220,11 @@ class ContentProcessor:
             sections_found = []
             missing_sections = []
 
+            # One scan of the content finds every required section header
+            # and whether there are markdown headers at all
+            present, has_headers = self._scan_headers(content, required_sections)
             for section in required_sections:
-                if self._section_exists_in_content(content, section):
+                if section in present:
                     sections_found.append(section)
                 else:
                     missing_sections.append(section)
@@ -1009,7 +1237,7 @@ class ContentProcessor:
             validation_result.missing_sections = missing_sections
 
             # Check content quality
-            self._validate_content_quality(content, document_type, validation_result)
+            self._validate_content_quality(content, document_type, validation_result, has_headers)
 
             return validation_result
 
@@ -1022,23 +1250,21 @@ class ContentProcessor:
                 suggestions=["Check content format and structure"]
             )
 
+    def _prompt_reference_summary(self, context: ProcessingContext) -> str:
+        """Return the reference materials block shared by every prompt."""
+        if not context.reference_resources:
+            return ""
+        return f"\n**Reference Materials Summary:**\n{context.reference_resources.content_summary}\n"
+
     def _create_prd_prompt(self, context: ProcessingContext, prd_structure: PRDStructure, template: Template) -> str:
         """Create intelligent prompt for PRD generation."""
-        reference_summary = ""
-        if context.reference_resources:
-            reference_summary = f"\n**Reference Materials Summary:**\n{context.reference_resources.content_summary}\n"
+        reference_summary = self._prompt_reference_summary(context)
 
-        user_stories_text = ""
-        if prd_structure.user_stories:
-            user_stories_text = "\n**Extracted User Stories:**\n"
-            for story in prd_structure.user_stories:
-                user_stories_text += f"- {story.get('story', 'N/A')}\n"
-
-        objectives_text = ""
-        if prd_structure.objectives:
-            objectives_text = "\n**Identified Objectives:**\n"
-            for obj in prd_structure.objectives:
-                objectives_text += f"- {obj}\n"
+        user_stories_text = _bullet_block(
+            "Extracted User Stories",
+            (story.get('story', 'N/A') for story in prd_structure.user_stories)
+        )
+        objectives_text = _bullet_block("Identified Objectives", prd_structure.objectives)
 
         prompt = f"""Create a comprehensive Product Requirements Document (PRD) following Kiro's standards and best practices.
 
@@ -1070,15 +1296,9 @@ Generate comprehensive, actionable content for each section based on the provide
 
     def _create_spec_prompt(self, context: ProcessingContext, spec_structure: SPECStructure, template: Template) -> str:
         """Create intelligent prompt for SPEC generation."""
-        reference_summary = ""
-        if context.reference_resources:
-            reference_summary = f"\n**Reference Materials Summary:**\n{context.reference_resources.content_summary}\n"
+        reference_summary = self._prompt_reference_summary(context)
 
-        components_text = ""
-        if spec_structure.components:
-            components_text = "\n**Identified Components:**\n"
-            for comp in spec_structure.components:
-                components_text += f"- {comp.get('name', 'N/A')}: {comp.get('description', 'N/A')}\n"
+        components_text = _bullet_block("Identified Components", map(_describe_component, spec_structure.components))
 
         prompt = f"""Create a comprehensive Technical Specification Document (SPEC) following Kiro's standards and best practices.
 
@@ -1111,15 +1331,9 @@ Generate detailed, technically sound content for each section based on the provi
 
     def _create_design_prompt(self, context: ProcessingContext, design_structure: DESIGNStructure, template: Template) -> str:
         """Create intelligent prompt for DESIGN generation."""
-        reference_summary = ""
-        if context.reference_resources:
-            reference_summary = f"\n**Reference Materials Summary:**\n{context.reference_resources.content_summary}\n"
+        reference_summary = self._prompt_reference_summary(context)
 
-        ui_components_text = ""
-        if design_structure.ui_components:
-            ui_components_text = "\n**Identified UI Components:**\n"
-            for comp in design_structure.ui_components:
-                ui_components_text += f"- {comp.get('name', 'N/A')}: {comp.get('description', 'N/A')}\n"
+        ui_components_text = _bullet_block("Identified UI Components", map(_describe_component, design_structure.ui_components))
 
         prompt = f"""Create a comprehensive Design Document (DESIGN) following Kiro's standards and best practices.
 
@@ -1154,8 +1368,12 @@ Generate comprehensive, actionable design content for each section based on the
         """Create a summary of the processing context."""
         summary_parts = [f"Document Type: {doc_type}"]
 
-        if context.project_context:
-            summary_parts.append(f"Project Context: {context.project_context[:100]}...")
+        project_context = context.project_context
+        if project_context:
+            # Only mark the context as cut off when it actually is
+            if len(project_context) > 100:
+                project_context = project_context[:100] + "..."
+            summary_parts.append(f"Project Context: {project_context}")
 
         if context.reference_resources:
             summary_parts.append(f"Reference Files: {context.reference_resources.total_files}")
@@ -1167,29 +1385,66 @@ Generate comprehensive, actionable design content for each section based on the
 
     def _get_references_list(self, context: ProcessingContext) -> List[str]:
         """Get list of reference materials used."""
-        references = []
-        if context.reference_resources:
-            for category, files in context.reference_resources.categorized_files.items():
-                for file_content in files:
-                    references.append(f"{category}: {file_content.file_path.name}")
-        return references
+        if not context.reference_resources:
+            return []
+        return [
+            f"{category}: {file_content.file_path.name}"
+            for category, files in context.reference_resources.categorized_files.items()
+            for file_content in files
+        ]
 
     def _section_exists_in_content(self, content: str, section_name: str) -> bool:
         """Check if a section exists in the content."""
-        # Look for markdown headers with the section name
-        patterns = [
-            rf"^#{1,6}\s*{re.escape(section_name)}\s*$",
-            rf"^#{1,6}\s*{re.escape(section_name.lower())}\s*$",
-            rf"^#{1,6}\s*{re.escape(section_name.upper())}\s*$",
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
-                return True
-        return False
+        return section_name in self._sections_in_content(content, (section_name,))
 
-    def _validate_content_quality(self, content: str, document_type: str, validation_result: ContentValidationResult):
-        """Validate content quality and add issues to validation result."""
+    def _sections_in_content(self, content: str, section_names: Sequence[str]) -> FrozenSet[str]:
+        """
+        Find which of the given sections have a markdown header in the content.
+        
+        Args:
+            content: Document content
+            section_names: Section names to look for
+            
+        Returns:
+            The section names that a header names, in any capitalisation
+        """
+        return self._scan_headers(content, section_names)[0]
+
+    def _scan_headers(self, content: str, section_names: Sequence[str]) -> Tuple[FrozenSet[str], bool]:
+        """
+        Scan the markdown headers of the content once.
+        
+        Args:
+            content: Document content
+            section_names: Section names to look for
+            
+        Returns:
+            Tuple of (section names that a header names, whether the content
+            has any markdown header)
+        """
+        section_names = tuple(section_names)
+        found = set()
+        has_headers = False
+        for match in _section_headers_re(section_names).finditer(content):
+            if match.group('space') is not None:
+                has_headers = True
+            section = match.lastgroup
+            if section is not None and section != 'space':
+                found.add(section_names[int(section[1:])])
+        return frozenset(found), has_headers
+
+    def _validate_content_quality(self, content: str, document_type: str, validation_result: ContentValidationResult,
+                                  has_headers: Optional[bool] = None):
+        """
+        Validate content quality and add issues to validation result.
+        
+        Args:
+            content: Document content
+            document_type: Document type ('prd', 'spec', 'design')
+            validation_result: Result to add issues to
+            has_headers: Whether the content has markdown headers, if the
+                caller has already scanned them
+        """
         # Check minimum content length
         if len(content.strip()) < 500:
             validation_result.add_issue(
@@ -1198,22 +1453,22 @@ Generate comprehensive, actionable design content for each section based on the
             )
 
         # Check for placeholder text
-        placeholder_patterns = [
-            r"\[.*?\]",  # [placeholder text]
-            r"TODO",
-            r"TBD",
-            r"PLACEHOLDER"
-        ]
-
-        for pattern in placeholder_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        found = set()
+        for match in _PLACEHOLDER_TEXT_SWEEP.finditer(content):
+            found.add(match.lastgroup)
+            if len(found) == len(_PLACEHOLDER_TEXT_PATTERNS):
+                break
+        for index, pattern in enumerate(_PLACEHOLDER_TEXT_PATTERNS):
+            if f"p{index}" in found:
                 validation_result.add_issue(
                     f"Found placeholder text: {pattern}",
                     "Replace placeholder text with actual content"
                 )
 
         # Check for proper markdown formatting
-        if not re.search(r"^#{1,6}\s+", content, re.MULTILINE):
+        if has_headers is None:
+            has_headers = _MARKDOWN_HEADER.search(content) is not None
+        if not has_headers:
             validation_result.add_issue(
                 "No markdown headers found",
                 "Use proper markdown headers (# ## ###) to structure the document"
@@ -1229,15 +1484,22 @@ Generate comprehensive, actionable design content for each section based on the
 
     def _validate_prd_specific_content(self, content: str, validation_result: ContentValidationResult):
         """Validate PRD-specific content requirements."""
+        # The regexes can only match where their literal words occur, so a
+        # substring test rules most misses out without running them
+        lowered = content.lower()
+        
         # Check for user stories
-        if not re.search(r"as\s+(?:a|an)\s+.*?i\s+want.*?so\s+that", content, re.IGNORECASE):
+        has_user_story = (
+            "want" in lowered and "that" in lowered and _USER_STORY_FORMAT.search(content) is not None
+        )
+        if not has_user_story:
             validation_result.add_issue(
                 "No properly formatted user stories found",
                 "Include user stories in the format: 'As a [user], I want [goal] so that [benefit]'"
             )
 
         # Check for acceptance criteria
-        if not re.search(r"acceptance\s+criteria", content, re.IGNORECASE):
+        if "acceptance" not in lowered or not _ACCEPTANCE_CRITERIA_MENTION.search(content):
             validation_result.add_issue(
                 "No acceptance criteria section found",
                 "Include acceptance criteria for user stories"
@@ -1246,8 +1508,7 @@ Generate comprehensive, actionable design content for each section based on the
     def _validate_spec_specific_content(self, content: str, validation_result: ContentValidationResult):
         """Validate SPEC-specific content requirements."""
         # Check for technical details
-        technical_keywords = ["API", "database", "component", "interface", "architecture"]
-        if not any(keyword.lower() in content.lower() for keyword in technical_keywords):
+        if not _TECHNICAL_KEYWORDS.search(content):
             validation_result.add_issue(
                 "Limited technical content found",
                 "Include more technical details about APIs, databases, components, etc."
@@ -1256,8 +1517,7 @@ Generate comprehensive, actionable design content for each section based on the
     def _validate_design_specific_content(self, content: str, validation_result: ContentValidationResult):
         """Validate DESIGN-specific content requirements."""
         # Check for design elements
-        design_keywords = ["UI", "UX", "interface", "workflow", "user experience"]
-        if not any(keyword.lower() in content.lower() for keyword in design_keywords):
+        if not _DESIGN_KEYWORDS.search(content):
             validation_result.add_issue(
                 "Limited design content found",
                 "Include more design details about UI, UX, workflows, etc."
@@ -5,9 +5,12 @@ This service orchestrates the document generation process, coordinating
 template management, resource analysis, and content processing.
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
+import asyncio
 import logging
+import re
 from datetime import datetime
 
 from ..models.core import (
@@ -25,12 +28,19 @@ from ..exceptions import (
     DocumentGeneratorError, 
     ContentGenerationError,
     ResourceAccessError,
-    TemplateValidationError
+    TemplateValidationError,
+    ValidationError
 )
 
 
 logger = logging.getLogger(__name__)
 
+_REFERENCE_CACHE_SIZE = 8
+_DOCUMENT_CACHE_SIZE = 16
+
+# A line whose first non-whitespace character is '#'
+_HEADER_LINE = re.compile(r'^[^\S\n]*#.*', re.MULTILINE)
+
 
 class DocumentGeneratorService:
     """Main service for orchestrating document generation."""
@@ -46,15 +56,35 @@ class DocumentGeneratorService:
         self.content_processor = content_processor or ContentProcessor(self.template_manager)
         self.output_directory = output_directory or Path.cwd()
         
+        # Reference analyses and existing documents keyed by path, each
+        # stored with the filesystem signature it was computed from (LRU order)
+        self._reference_cache: "OrderedDict[str, Tuple[Tuple[int, int], ResourceAnalysis]]" = OrderedDict()
+        self._document_cache: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = OrderedDict()
+        
         # Note: Directory creation is deferred until actually needed
     
+    @property
+    def output_directory(self) -> Path:
+        """Directory generated documents are saved to."""
+        return self._output_directory
+    
+    @output_directory.setter
+    def output_directory(self, value: Path) -> None:
+        self._output_directory = value
+        # A new directory has not been checked yet
+        self._dir_ready = False
+    
     def _ensure_output_directory(self) -> None:
         """Ensure the output directory exists, creating it if necessary."""
+        if self._dir_ready:
+            return
+        
         try:
-            # Resolve the path to absolute
-            resolved_path = self.output_directory.resolve()
-            resolved_path.mkdir(parents=True, exist_ok=True)
-            self.output_directory = resolved_path
+            # Absolute paths are used as given; only relative ones need resolve()
+            if not self.output_directory.is_absolute():
+                self.output_directory = self.output_directory.resolve()
+            self.output_directory.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
         except (PermissionError, OSError) as e:
             logger.warning(f"Could not create output directory {self.output_directory}: {e}")
             # Fall back to a generated_docs folder in current working directory
@@ -62,6 +92,7 @@ class DocumentGeneratorService:
             try:
                 fallback_dir.mkdir(parents=True, exist_ok=True)
                 self.output_directory = fallback_dir
+                self._dir_ready = True
                 logger.info(f"Using fallback directory as output: {self.output_directory}")
             except (PermissionError, OSError) as e2:
                 logger.error(f"Could not create fallback directory: {e2}")
@@ -72,7 +103,7 @@ class DocumentGeneratorService:
     async def generate_prd(self, 
                           user_input: str,
                           project_context: str = "",
-                          reference_folder: str = "reference_resources",
+                          reference_folder: Union[str, Path, None] = "reference_resources",
                           template_config: str = "default") -> DocumentResult:
         """Generate Product Requirements Document (PRD.md)."""
         try:
@@ -91,11 +122,12 @@ class DocumentGeneratorService:
             await self._save_document(file_path, content)
             
             # Create document result
+            analysis = self._analyze_content(content)
             result = DocumentResult(
                 file_path=file_path,
                 content=content,
-                summary=self._generate_summary(content, "PRD"),
-                sections_generated=self._extract_sections(content),
+                summary=self._generate_summary(analysis, "PRD"),
+                sections_generated=analysis['sections'],
                 references_used=self._extract_references(context),
                 warnings=[],
                 metadata={
@@ -116,7 +148,7 @@ class DocumentGeneratorService:
     async def generate_spec(self,
                            requirements_input: str,
                            existing_prd_path: str = "",
-                           reference_folder: str = "reference_resources", 
+                           reference_folder: Union[str, Path, None] = "reference_resources", 
                            template_config: str = "default") -> DocumentResult:
         """Generate Technical Specification Document (SPEC.md)."""
         try:
@@ -140,11 +172,12 @@ class DocumentGeneratorService:
             await self._save_document(file_path, content)
             
             # Create document result
+            analysis = self._analyze_content(content)
             result = DocumentResult(
                 file_path=file_path,
                 content=content,
-                summary=self._generate_summary(content, "SPEC"),
-                sections_generated=self._extract_sections(content),
+                summary=self._generate_summary(analysis, "SPEC"),
+                sections_generated=analysis['sections'],
                 references_used=self._extract_references(context),
                 warnings=[],
                 metadata={
@@ -166,7 +199,7 @@ class DocumentGeneratorService:
     async def generate_design(self,
                              specification_input: str,
                              existing_spec_path: str = "",
-                             reference_folder: str = "reference_resources",
+                             reference_folder: Union[str, Path, None] = "reference_resources",
                              template_config: str = "default") -> DocumentResult:
         """Generate Design Document (DESIGN.md)."""
         try:
@@ -190,11 +223,12 @@ class DocumentGeneratorService:
             await self._save_document(file_path, content)
             
             # Create document result
+            analysis = self._analyze_content(content)
             result = DocumentResult(
                 file_path=file_path,
                 content=content,
-                summary=self._generate_summary(content, "DESIGN"),
-                sections_generated=self._extract_sections(content),
+                summary=self._generate_summary(analysis, "DESIGN"),
+                sections_generated=analysis['sections'],
                 references_used=self._extract_references(context),
                 warnings=[],
                 metadata={
@@ -216,37 +250,86 @@ class DocumentGeneratorService:
     async def _create_processing_context(self,
                                         user_input: str,
                                         project_context: str,
-                                        reference_folder: str,
+                                        reference_folder: Union[str, Path, None],
                                         template_config: str) -> ProcessingContext:
         """Create processing context with resource analysis."""
-        # Analyze reference resources if folder exists
-        reference_resources = None
-        if reference_folder:
-            reference_path = Path(reference_folder)
-            if reference_path.exists():
-                try:
-                    reference_resources = await self.resource_analyzer.analyze_folder(reference_path)
-                    logger.info(f"Analyzed {reference_resources.total_files} reference files")
-                except ResourceAccessError as e:
-                    logger.warning(f"Failed to analyze reference resources: {e}")
-        
         return ProcessingContext(
             user_input=user_input,
-            reference_resources=reference_resources,
+            reference_resources=await self._analyze_reference_folder(reference_folder),
             template_config=template_config,
             project_context=project_context,
             generation_mode="full"
         )
     
+    async def _analyze_reference_folder(self,
+                                        reference_folder: Union[str, Path, None]) -> Optional[ResourceAnalysis]:
+        """Analyze reference resources if the folder exists, reusing unchanged analyses."""
+        if not reference_folder:
+            return None
+        
+        # Validated folders arrive as Path already
+        reference_path = reference_folder if isinstance(reference_folder, Path) else Path(reference_folder)
+        if not reference_path.exists():
+            return None
+        
+        key: Optional[str]
+        signature: Optional[Tuple[int, int]]
+        try:
+            key = str(reference_path.resolve())
+            signature = await asyncio.to_thread(self.resource_analyzer.folder_signature, reference_path)
+        except OSError as e:
+            logger.warning(f"Failed to inspect reference folder {reference_path}: {e}")
+            key = signature = None
+        
+        if key is not None and signature is not None:
+            cached = self._reference_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                self._reference_cache.move_to_end(key)
+                logger.info(f"Reusing analysis of {cached[1].total_files} reference files")
+                return cached[1]
+        
+        try:
+            reference_resources = await self.resource_analyzer.analyze_folder(reference_path)
+            logger.info(f"Analyzed {reference_resources.total_files} reference files")
+        except ResourceAccessError as e:
+            logger.warning(f"Failed to analyze reference resources: {e}")
+            return None
+        
+        if key is not None and signature is not None:
+            self._reference_cache[key] = (signature, reference_resources)
+            self._reference_cache.move_to_end(key)
+            if len(self._reference_cache) > _REFERENCE_CACHE_SIZE:
+                self._reference_cache.popitem(last=False)
+        return reference_resources
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached reference analyses and existing document contents."""
+        self._reference_cache.clear()
+        self._document_cache.clear()
+    
     async def _enhance_with_existing_document(self, 
                                              input_text: str, 
                                              existing_doc_path: str) -> str:
         """Enhance input with content from existing document."""
-        if not existing_doc_path or not Path(existing_doc_path).exists():
+        if not existing_doc_path:
+            return input_text
+        
+        try:
+            stat = Path(existing_doc_path).stat()
+        except OSError:
             return input_text
         
         try:
-            existing_content = Path(existing_doc_path).read_text(encoding='utf-8')
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._document_cache.get(existing_doc_path)
+            if cached is not None and cached[0] == signature:
+                existing_content = cached[1]
+            else:
+                existing_content = Path(existing_doc_path).read_text(encoding='utf-8')
+                self._document_cache[existing_doc_path] = (signature, existing_content)
+                if len(self._document_cache) > _DOCUMENT_CACHE_SIZE:
+                    self._document_cache.popitem(last=False)
+            self._document_cache.move_to_end(existing_doc_path)
             enhanced_input = f"{input_text}\n\n--- Existing Document Context ---\n{existing_content}"
             logger.info(f"Enhanced input with existing document: {existing_doc_path}")
             return enhanced_input
@@ -260,7 +343,13 @@ class DocumentGeneratorService:
             # Ensure output directory exists before saving
             self._ensure_output_directory()
             
-            file_path.write_text(content, encoding='utf-8')
+            try:
+                file_path.write_text(content, encoding='utf-8')
+            except FileNotFoundError:
+                # The directory was removed after it was last checked
+                self._dir_ready = False
+                self._ensure_output_directory()
+                file_path.write_text(content, encoding='utf-8')
             logger.info(f"Document saved to: {file_path}")
         except Exception as e:
             logger.error(f"Failed to save document to {file_path}: {e}")
@@ -273,48 +362,34 @@ class DocumentGeneratorService:
                 ]
             )
 
-    def _generate_summary(self, content: str, doc_type: str) -> str:
-        """Generate a summary of the document content."""
-        lines = content.split('\n')
-        non_empty_lines = [line for line in lines if line.strip()]
-
-        # Count sections (lines starting with #)
-        sections = [line for line in non_empty_lines if line.strip().startswith('#')]
-
-        # Count words
-        word_count = len(content.split())
+    def _analyze_content(self, content: str) -> Dict[str, Any]:
+        """Collect header lines, section names and counts in one scan of the content."""
+        # Header lines as written; the summary and the section list clean them differently
+        headers = _HEADER_LINE.findall(content)
+        return {
+            'headers': headers,
+            'sections': [title for title in (h.strip().lstrip('#').strip() for h in headers) if title],
+            'word_count': len(content.split()),
+            'char_count': len(content)
+        }
 
-        # Count characters
-        char_count = len(content)
+    def _generate_summary(self, analysis: Dict[str, Any], doc_type: str) -> str:
+        """Generate a summary of the document from its content analysis."""
+        headers = analysis['headers']
 
         summary = (
-            f"Generated {doc_type} document with {len(sections)} sections, "
-            f"{word_count} words, and {char_count} characters."
+            f"Generated {doc_type} document with {len(headers)} sections, "
+            f"{analysis['word_count']} words, and {analysis['char_count']} characters."
         )
 
-        if sections:
-            main_sections = [s.strip('#').strip() for s in sections[:3]]
+        if headers:
+            main_sections = [s.strip('#').strip() for s in headers[:3]]
             summary += f" Main sections: {', '.join(main_sections)}"
-            if len(sections) > 3:
-                summary += f" and {len(sections) - 3} more."
+            if len(headers) > 3:
+                summary += f" and {len(headers) - 3} more."
 
         return summary
 
-    def _extract_sections(self, content: str) -> List[str]:
-        """Extract section names from document content."""
-        sections = []
-        lines = content.split('\n')
-
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith('#'):
-                # Extract section title (remove # and clean up)
-                section_title = stripped.lstrip('#').strip()
-                if section_title:
-                    sections.append(section_title)
-
-        return sections
-
     def _extract_references(self, context: ProcessingContext) -> List[str]:
         """Extract references used during generation."""
         references = []
@@ -376,10 +451,59 @@ class DocumentGeneratorService:
             context_data['template_config'] = "default"
             return await self.generate_document_with_fallbacks(doc_type, input_data, context_data)
 
+    async def generate_documents_with_fallbacks(self,
+                                               inputs: Dict[str, str],
+                                               context_data: Dict[str, Any]) -> Dict[str, Union[DocumentResult, Exception]]:
+        """
+        Generate several document types concurrently with per-document fallbacks.
+        
+        Args:
+            inputs: Input text keyed by document type ("prd", "spec", "design")
+            context_data: Options shared by every document; "concurrency" caps
+                how many documents are generated at once (default 3)
+            
+        Returns:
+            Result keyed by document type; a document that failed maps to the
+            exception it raised instead of aborting the batch
+            
+        Raises:
+            ValidationError: If the concurrency is not a positive integer
+        """
+        concurrency = context_data.get('concurrency', 3)
+        if not isinstance(concurrency, int) or concurrency < 1:
+            # A zero-sized semaphore would never admit a document
+            raise ValidationError("concurrency", [f"Must be a positive integer, got {concurrency!r}"])
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # Analyze the shared reference folder once up front so the concurrent
+        # documents all find it cached instead of each walking it
+        await self._analyze_reference_folder(context_data.get('reference_folder', 'reference_resources'))
+
+        async def generate(doc_type: str, input_data: str) -> DocumentResult:
+            async with semaphore:
+                # Fallbacks rewrite context_data, so each document gets its own copy
+                return await self.generate_document_with_fallbacks(
+                    doc_type, input_data, dict(context_data)
+                )
+
+        results = await asyncio.gather(
+            *(generate(doc_type, input_data) for doc_type, input_data in inputs.items()),
+            return_exceptions=True
+        )
+        
+        # Only ordinary failures are per-document results; cancellation and
+        # other BaseExceptions must still propagate
+        batch: Dict[str, Union[DocumentResult, Exception]] = {}
+        for doc_type, result in zip(inputs, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            batch[doc_type] = result
+        return batch
+
     async def generate_prd_prompt(self,
                                   user_input: str,
                                   project_context: str = "",
-                                  reference_folder: str = "reference_resources",
+                                  reference_folder: Union[str, Path, None] = "reference_resources",
                                   template_config: str = "default") -> PromptResult:
         """Generate intelligent prompt for PRD creation."""
         try:
@@ -403,7 +527,7 @@ class DocumentGeneratorService:
     async def generate_spec_prompt(self,
                                    requirements_input: str,
                                    existing_prd_path: str = "",
-                                   reference_folder: str = "reference_resources",
+                                   reference_folder: Union[str, Path, None] = "reference_resources",
                                    template_config: str = "default") -> PromptResult:
         """Generate intelligent prompt for SPEC creation."""
         try:
@@ -432,7 +556,7 @@ class DocumentGeneratorService:
     async def generate_design_prompt(self,
                                      specification_input: str,
                                      existing_spec_path: str = "",
-                                     reference_folder: str = "reference_resources",
+                                     reference_folder: Union[str, Path, None] = "reference_resources",
                                      template_config: str = "default") -> PromptResult:
         """Generate intelligent prompt for DESIGN creation."""
         try:
@@ -6,9 +6,10 @@ and extracts relevant information for document generation.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple, Union
 import logging
 import asyncio
+import os
 from datetime import datetime
 
 from ..models.core import ResourceAnalysis, FileContent
@@ -18,6 +19,23 @@ from ..exceptions import ResourceAccessError, FileProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Substrings of file names that mark system, temporary, lock and backup files
+_SKIP_NAME_PATTERNS = (
+    # System files
+    'thumbs.db', 'desktop.ini', '.ds_store',
+    # Temporary files
+    '~$', '.tmp', '.temp',
+    # Lock files
+    '.lock', '.lck',
+    # Backup files
+    '.bak', '.backup', '.old'
+)
+
+# Directories never walked, besides hidden ones (.git, .venv, ...)
+_SKIP_DIR_NAMES = frozenset({'node_modules', '__pycache__'})
+
+_MAX_FILE_SIZE = 100 * 1024 * 1024
+
 
 class ResourceAnalyzerService:
     """Service for analyzing reference resources."""
@@ -78,16 +96,12 @@ class ResourceAnalyzerService:
             
             logger.info(f"Starting analysis of folder: {folder_path}")
             
-            # Find all files recursively
-            all_files = self._find_files(folder_path)
-            logger.info(f"Found {len(all_files)} files to analyze")
-            
-            # Filter processable files
-            processable_files = [f for f in all_files if self.file_registry.can_process(f)]
-            skipped_files = len(all_files) - len(processable_files)
-            
-            if skipped_files > 0:
-                logger.info(f"Skipping {skipped_files} files with unsupported formats")
+            # The directory walk is blocking filesystem work; run it off the
+            # event loop so other tools keep running. Access is validated by
+            # each processor as it opens its file.
+            all_files, processable_files = await asyncio.to_thread(
+                self._discover_files, folder_path
+            )
             
             # Process files concurrently
             processed_files = await self._process_files(processable_files)
@@ -130,54 +144,104 @@ class ResourceAnalyzerService:
                 ]
             )
     
+    def _discover_files(self, folder_path: Path) -> Tuple[List[Path], List[Path]]:
+        """Find all files and the subset that can be processed."""
+        # Find all files recursively
+        all_files = self._find_files(folder_path)
+        logger.info(f"Found {len(all_files)} files to analyze")
+        
+        # Filter processable files
+        processable_files = [f for f in all_files if self.file_registry.can_process(f)]
+        skipped_files = len(all_files) - len(processable_files)
+        
+        if skipped_files > 0:
+            logger.info(f"Skipping {skipped_files} files with unsupported formats")
+        
+        return all_files, processable_files
+    
     def _find_files(self, folder_path: Path) -> List[Path]:
         """Find all files in the folder recursively."""
         files = []
         
-        try:
-            for item in folder_path.rglob("*"):
-                if item.is_file():
-                    # Skip hidden files and common non-content files
-                    if not self._should_skip_file(item):
-                        files.append(item)
-        except PermissionError as e:
-            logger.warning(f"Permission denied accessing some files in {folder_path}: {e}")
-        except Exception as e:
-            logger.error(f"Error finding files in {folder_path}: {e}")
+        # Explicit scandir stack: directory entries carry their type, so only
+        # the files we keep cost a stat() (for the size check)
+        pending = [os.fspath(folder_path)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if not self._should_skip_dir(entry.name):
+                                    pending.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                # Skip hidden files and common non-content files
+                                if self._should_skip_name(entry.name):
+                                    continue
+                                size = entry.stat(follow_symlinks=False).st_size
+                                if not self._should_skip_size(entry.path, size):
+                                    files.append(Path(entry.path))
+                        except OSError:
+                            continue
+            except PermissionError as e:
+                logger.warning(f"Permission denied accessing some files in {directory}: {e}")
+            except Exception as e:
+                logger.error(f"Error finding files in {directory}: {e}")
         
         return files
     
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """Check if a file should be skipped during analysis."""
+    def folder_signature(self, folder_path: Path) -> Tuple[int, int]:
+        """
+        Summarize what an analysis of a folder would see as (entry count, newest mtime in ns).
+        
+        Walks the same directories and files as _find_files, so a changed
+        signature means the analysis may differ. Folder mtimes alone miss
+        files edited in place, so every kept entry is stat'ed; that is far
+        cheaper than re-reading and re-processing them.
+        
+        Raises:
+            OSError: If the folder itself cannot be read
+        """
+        count = 0
+        newest = os.stat(folder_path).st_mtime_ns
+        pending = [os.fspath(folder_path)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self._should_skip_dir(entry.name):
+                                continue
+                            pending.append(entry.path)
+                        elif self._should_skip_name(entry.name):
+                            continue
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    except OSError:
+                        continue
+                    count += 1
+        return count, newest
+    
+    def _should_skip_dir(self, dir_name: str) -> bool:
+        """Check if a directory is hidden or holds dependencies or build output."""
+        return dir_name.startswith('.') or dir_name in _SKIP_DIR_NAMES
+    
+    def _should_skip_name(self, file_name: str) -> bool:
+        """Check if a file name marks a hidden or non-content file."""
         # Skip hidden files
-        if file_path.name.startswith('.'):
+        if file_name.startswith('.'):
             return True
         
         # Skip common non-content files
-        skip_patterns = {
-            # System files
-            'thumbs.db', 'desktop.ini', '.ds_store',
-            # Temporary files
-            '~$', '.tmp', '.temp',
-            # Lock files
-            '.lock', '.lck',
-            # Backup files
-            '.bak', '.backup', '.old'
-        }
-        
-        file_name_lower = file_path.name.lower()
-        for pattern in skip_patterns:
-            if pattern in file_name_lower:
-                return True
-        
+        file_name_lower = file_name.lower()
+        return any(pattern in file_name_lower for pattern in _SKIP_NAME_PATTERNS)
+    
+    def _should_skip_size(self, file_path: Union[str, Path], size: int) -> bool:
+        """Check if a file is too large to analyze."""
         # Skip very large files (>100MB)
-        try:
-            if file_path.stat().st_size > 100 * 1024 * 1024:
-                logger.warning(f"Skipping large file: {file_path} ({file_path.stat().st_size} bytes)")
-                return True
-        except OSError:
-            pass
-        
+        if size > _MAX_FILE_SIZE:
+            logger.warning(f"Skipping large file: {file_path} ({size} bytes)")
+            return True
         return False
     
     async def _process_files(self, files: List[Path]) -> List[FileContent]:
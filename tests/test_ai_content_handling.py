@@ -283,3 +283,12 @@ Complete introduction.
         assert result.is_valid is False
         assert result.document_type == "invalid_type"
         assert len(result.quality_issues) > 0
+    
+    @pytest.mark.asyncio
+    async def test_validate_unknown_type_with_headers(self, service):
+        """Test that headers are scanned even with no required sections."""
+        result = await service.validate_ai_content("invalid_type", "# Heading\n\nSome content")
+        
+        assert result.sections_found == []
+        assert not any("Validation error" in issue for issue in result.quality_issues)
+        assert not any("No markdown headers" in issue for issue in result.quality_issues)
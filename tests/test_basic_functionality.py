@@ -18,6 +18,8 @@ from document_generator_mcp.models.document_structures import PRDStructure, SPEC
 from document_generator_mcp.processors.registry import FileProcessorRegistry
 from document_generator_mcp.templates.manager import TemplateManager
 from document_generator_mcp.services.document_generator import DocumentGeneratorService
+from document_generator_mcp.services.content_processor import ContentProcessor
+from document_generator_mcp.services.resource_analyzer import ResourceAnalyzerService
 
 
 class TestBasicImports:
@@ -262,6 +264,42 @@ class TestTemplateManager:
         assert validation_result.is_valid
 
 
+class TestResourceAnalyzer:
+    """Test reference folder walking."""
+    
+    def test_folder_signature_ignores_skipped_directories(self):
+        """Test that changes under hidden and dependency folders keep the signature."""
+        analyzer = ResourceAnalyzerService()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(temp_dir)
+            (folder / "notes.md").write_text("notes")
+            (folder / ".git").mkdir()
+            (folder / "node_modules").mkdir()
+            signature = analyzer.folder_signature(folder)
+            
+            (folder / ".git" / "HEAD").write_text("ref")
+            (folder / "node_modules" / "index.js").write_text("js")
+            
+            assert analyzer.folder_signature(folder) == signature
+            assert analyzer._find_files(folder) == [folder / "notes.md"]
+
+
+class TestContentProcessor:
+    """Test content extraction from user input."""
+    
+    def test_extract_objectives_singular_headings(self):
+        """Test that singular headings match patterns with an optional plural."""
+        processor = ContentProcessor()
+        user_input = (
+            "Objective: make login faster\n- reduce latency\n- cache sessions\n\n"
+            "Goal: happy users"
+        )
+        
+        assert processor._extract_objectives(user_input) == [
+            "make login faster", "reduce latency", "cache sessions", "happy users"
+        ]
+
+
 class TestDocumentGenerator:
     """Test document generator service."""
     
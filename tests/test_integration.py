@@ -7,12 +7,14 @@ end-to-end.
 
 import pytest
 import asyncio
+import os
 import tempfile
 import shutil
 from pathlib import Path
 
 from document_generator_mcp.services.document_generator import DocumentGeneratorService
 from document_generator_mcp.services.resource_analyzer import ResourceAnalyzerService
+from document_generator_mcp.exceptions import DocumentGeneratorError, ValidationError
 
 
 class TestDocumentGenerationIntegration:
@@ -208,6 +210,78 @@ class TestDocumentGenerationIntegration:
         
         # Should have a warning or indication that resources weren't used
         assert result.metadata.get('has_reference_resources') is False
+    
+    @pytest.mark.asyncio
+    async def test_batch_generation_isolates_failures(self, temp_workspace):
+        """Test that one failing document does not abort a batch."""
+        service = DocumentGeneratorService(output_directory=temp_workspace)
+        
+        results = await service.generate_documents_with_fallbacks(
+            {
+                "prd": "Create a task management application",
+                "unknown": "Not a real document type"
+            },
+            {"reference_folder": "", "template_config": "default_prd"}
+        )
+        
+        assert list(results) == ["prd", "unknown"]
+        assert results["prd"].file_path.name == "PRD.md"
+        assert isinstance(results["unknown"], DocumentGeneratorError)
+    
+    @pytest.mark.asyncio
+    async def test_batch_generation_rejects_zero_concurrency(self, temp_workspace):
+        """Test that a batch that could never start is rejected up front."""
+        service = DocumentGeneratorService(output_directory=temp_workspace)
+        
+        with pytest.raises(ValidationError):
+            await service.generate_documents_with_fallbacks(
+                {"prd": "Create a task management application"},
+                {"reference_folder": "", "concurrency": 0}
+            )
+    
+    @pytest.mark.asyncio
+    async def test_reference_analysis_reused_until_folder_changes(self, temp_workspace):
+        """Test that unchanged reference folders are analyzed only once."""
+        service = DocumentGeneratorService(output_directory=temp_workspace)
+        ref_dir = temp_workspace / "reference_resources"
+        
+        analyze_folder = service.resource_analyzer.analyze_folder
+        calls = []
+        
+        async def counting_analyze_folder(folder_path):
+            calls.append(folder_path)
+            return await analyze_folder(folder_path)
+        
+        service.resource_analyzer.analyze_folder = counting_analyze_folder
+        
+        first = await service._create_processing_context("input", "", ref_dir, "default")
+        second = await service._create_processing_context("other input", "", str(ref_dir), "default")
+        assert len(calls) == 1
+        assert second.reference_resources is first.reference_resources
+        
+        # Editing a file in place leaves the folder mtime alone but still counts
+        requirements = ref_dir / "requirements.md"
+        requirements.write_text("# Updated Requirements")
+        stat = requirements.stat()
+        os.utime(requirements, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        await service._create_processing_context("input", "", ref_dir, "default")
+        assert len(calls) == 2
+        
+        service.invalidate_cache()
+        await service._create_processing_context("input", "", ref_dir, "default")
+        assert len(calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_output_directory_recreated_after_removal(self, temp_workspace):
+        """Test that saving recreates an output directory removed after first use."""
+        output_dir = temp_workspace / "docs"
+        service = DocumentGeneratorService(output_directory=output_dir)
+        
+        await service._save_document(output_dir / "first.md", "first")
+        shutil.rmtree(output_dir)
+        await service._save_document(output_dir / "second.md", "second")
+        
+        assert (output_dir / "second.md").read_text() == "second"
 
 
 if __name__ == "__main__":
@@ -18,10 +18,12 @@ from document_generator_mcp.security import (
     sanitize_template_content,
     validate_template_structure,
     is_safe_path,
+    normalize_path,
     secure_path_join,
+    validate_and_open,
     get_secure_defaults,
 )
-from document_generator_mcp.exceptions import ValidationError, TemplateValidationError
+from document_generator_mcp.exceptions import ValidationError, TemplateValidationError, ResourceAccessError
 
 
 class TestInputValidation:
@@ -108,12 +110,107 @@ class TestPathSecurity:
             with pytest.raises(ValidationError):
                 validate_file_path(outside_file, base_directory=base_dir)
     
+    def test_validate_file_path_follows_symlinks_within_base(self):
+        """Test that symlinked directories are followed, not rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir)
+            target_dir = base_dir / "target"
+            target_dir.mkdir()
+            link_dir = base_dir / "link"
+            link_dir.symlink_to(target_dir)
+            
+            # Resolves inside the base directory
+            linked_file = link_dir / "file.md"
+            assert validate_file_path(linked_file, base_directory=base_dir) == linked_file
+            
+            # Relative paths are not checked against the base directory
+            assert validate_file_path("documents/test.md", base_directory=base_dir) == Path("documents/test.md")
+            
+            # A sibling sharing the base directory's name as a prefix is outside it
+            with pytest.raises(ValidationError):
+                validate_file_path(Path(f"{temp_dir}_evil/file.md"), base_directory=base_dir)
+    
     def test_is_safe_path(self):
         """Test safe path checking."""
         assert is_safe_path("documents/test.md")
         assert not is_safe_path("../../../etc/passwd")
         assert not is_safe_path("/etc/passwd", allow_absolute=False)
     
+    def test_normalize_path_rejects_symlinks(self):
+        """Test that symlinks are rejected before resolution."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir)
+            target_dir = base_dir / "target"
+            target_dir.mkdir()
+            (target_dir / "file.md").touch()
+            link_dir = base_dir / "link"
+            link_dir.symlink_to(target_dir)
+            
+            with pytest.raises(ValidationError):
+                normalize_path(link_dir / "file.md", base_directory=base_dir)
+            
+            assert normalize_path(link_dir / "file.md", allow_symlinks=True) == (target_dir / "file.md").resolve()
+    
+    def test_normalize_path_rechecks_symlinks(self):
+        """Test that a symlink swapped in after a successful check is rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir)
+            sub_dir = base_dir / "sub"
+            sub_dir.mkdir()
+            (sub_dir / "f.md").touch()
+            other_dir = base_dir / "other"
+            other_dir.mkdir()
+            (other_dir / "f.md").touch()
+            
+            normalize_path(sub_dir / "f.md", base_directory=base_dir)
+            
+            (sub_dir / "f.md").unlink()
+            sub_dir.rmdir()
+            sub_dir.symlink_to(other_dir)
+            
+            with pytest.raises(ValidationError):
+                normalize_path(sub_dir / "f.md", base_directory=base_dir)
+    
+    def test_symlinked_ancestor_of_base_allowed(self):
+        """Test that a base directory reached through a symlink can be read."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            real_dir = Path(temp_dir) / "real"
+            project_dir = real_dir / "proj"
+            project_dir.mkdir(parents=True)
+            (project_dir / "notes.md").write_bytes(b"notes")
+            link_dir = Path(temp_dir) / "link"
+            link_dir.symlink_to(real_dir)
+            
+            linked_project = link_dir / "proj"
+            for base_dir in (linked_project, project_dir):
+                path, file_obj = validate_and_open(linked_project / "notes.md", base_directory=base_dir)
+                with file_obj:
+                    assert path == (project_dir / "notes.md").resolve()
+                    assert file_obj.read() == b"notes"
+            
+            # Symlinks below the base are still rejected
+            outside_dir = Path(temp_dir) / "outside"
+            outside_dir.mkdir()
+            (outside_dir / "secret.md").write_bytes(b"secret")
+            (project_dir / "docs").symlink_to(outside_dir)
+            with pytest.raises(ValidationError):
+                normalize_path(linked_project / "docs" / "secret.md", base_directory=linked_project)
+
+    def test_validate_and_open(self):
+        """Test that validation hands back the already-open file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir).resolve()
+            safe_file = base_dir / "safe.txt"
+            safe_file.write_bytes(b"content")
+            
+            path, file_obj = validate_and_open(safe_file, base_directory=base_dir)
+            with file_obj:
+                assert path == safe_file
+                assert file_obj.read() == b"content"
+            
+            with pytest.raises(ResourceAccessError):
+                validate_and_open(base_dir, base_directory=base_dir)
+    
     def test_secure_path_join(self):
         """Test secure path joining."""
         base = Path("/safe/base")
@@ -141,6 +238,14 @@ class TestContentSecurity:
         assert "<script>" not in result
         assert "Some content" in result
     
+    def test_sanitize_log_data_redacts_dict_subclasses(self):
+        """Test that mapping subclasses still get sensitive keys redacted."""
+        from collections import OrderedDict
+        from document_generator_mcp.security.logging_security import sanitize_log_data
+        
+        result = sanitize_log_data(OrderedDict(password="hunter2", items=("a", "b")))
+        assert result == {"password": "[REDACTED]", "items": ["a", "b"]}
+    
     def test_sanitize_template_content_normal(self):
         """Test normal template content sanitization."""
         normal_template = "# {title}\n\nThis is a template with {placeholder}."